@@ -1,24 +1,92 @@
 # helixlang/cli/file_runner.py
 
+import functools
+import logging
 import os
+import stat
 import sys
-import traceback
-from helixlang.parser import parse_source_code
+import threading
+from collections import OrderedDict
+from helixlang.parser import parse_source_stream
 from helixlang.ir import load_ir, compile_ast_to_ir
 from helixlang.runtime import execute_ir, execute_source
-from helixlang.io import read_file, write_file
+from helixlang.io import write_file
 from helixlang.utils import colorize
 
 COLOR_ERROR = "\033[91m"
 COLOR_RESET = "\033[0m"
 
+logger = logging.getLogger("helixlang.cli")
+
+# Read buffer for streaming source files into the tokenizer
+SOURCE_READ_BUFFER = 1 << 16
+
+# Compiled IR keyed on file identity (see _file_key), least recently used first
+IR_CACHE_SIZE = 64
+_ir_cache = OrderedDict()
+
+
+def _file_key(filepath: str, st: os.stat_result):
+    """
+    Cache key for a file's contents: path, inode and nanosecond mtime plus
+    size, so a same-size save within one coarse mtime tick, or a file
+    replaced by rename (as many editors save), is still seen as changed.
+    """
+    return (filepath, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _compile_cached(fd: int, filepath: str, st: os.stat_result):
+    """
+    Parse and compile an open source file to IR, streaming it into the
+    tokenizer so the full source text is never held alongside the AST.
+    Keyed on _file_key(): unchanged files (e.g. repeated runs in watch
+    mode) reuse the IR instead of rebuilding the AST.
+    Takes ownership of `fd` and closes it.
+    """
+    key = _file_key(filepath, st)
+    ir = _ir_cache.get(key)
+    if ir is not None:
+        os.close(fd)
+        _ir_cache.move_to_end(key)
+        return ir
+
+    with os.fdopen(fd, "r", encoding="utf-8", buffering=SOURCE_READ_BUFFER) as fp:
+        ast = parse_source_stream(fp)
+    ir = compile_ast_to_ir(ast)
+
+    _ir_cache[key] = ir
+    if len(_ir_cache) > IR_CACHE_SIZE:
+        _ir_cache.popitem(last=False)
+    return ir
+
+
+@functools.lru_cache(maxsize=64)
+def _load_ir_cached(filepath: str, key: tuple):
+    """
+    Load an IR file, keyed on _file_key() so unchanged files are not re-read.
+    """
+    return load_ir(filepath)
+
+
 def run_file(filepath: str, *, debug=False):
     """
     Entry point to load, compile (if needed), and execute a HelixLang file.
     Supports `.hlx` (source) and `.hxir` (intermediate representation).
     """
 
-    if not os.path.isfile(filepath):
+    # Open once and fstat the descriptor, rather than stat-ing the path
+    # for an existence check and again for the cache key
+    try:
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        fd = None
+    except OSError as e:  # e.g. PermissionError
+        print(colorize(f"Cannot read file {filepath}: {e.strerror or e}", COLOR_ERROR))
+        sys.exit(1)
+    st = os.fstat(fd) if fd is not None else None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        if fd is not None:
+            os.close(fd)
         print(colorize(f"File not found: {filepath}", COLOR_ERROR))
         sys.exit(1)
 
@@ -27,20 +95,11 @@ def run_file(filepath: str, *, debug=False):
 
     try:
         if ext == ".hlx":
-            # Read source code
-            source = read_file(filepath)
-
-            if debug:
-                print(f"Parsing source from {filepath}...")
-
-            # Parse AST
-            ast = parse_source_code(source)
-
             if debug:
-                print("Compiling AST to IR...")
+                print(f"Parsing and compiling source from {filepath}...")
 
-            # Compile AST to IR
-            ir = compile_ast_to_ir(ast)
+            # Parse AST and compile to IR (cached by file identity)
+            ir = _compile_cached(fd, filepath, st)
 
             if debug:
                 print(f"Executing IR for {filepath}...")
@@ -55,7 +114,8 @@ def run_file(filepath: str, *, debug=False):
             if debug:
                 print(f"Loading IR from {filepath}...")
 
-            ir = load_ir(filepath)
+            os.close(fd)  # load_ir opens the file itself on a cache miss
+            ir = _load_ir_cached(filepath, _file_key(filepath, st))
 
             if debug:
                 print("Executing loaded IR...")
@@ -65,47 +125,77 @@ def run_file(filepath: str, *, debug=False):
             return result
 
         else:
+            os.close(fd)
             print(colorize(f"Unsupported file type: {ext}", COLOR_ERROR))
             sys.exit(1)
 
-    except Exception as e:
-        tb = traceback.format_exc()
-        print(colorize(f"Error running file {filepath}:\n{tb}", COLOR_ERROR))
+    except Exception:
+        # The traceback is only formatted if the logger will emit the record
+        logger.exception("Error running file %s", filepath)
         sys.exit(1)
 
 # Optional: Watcher to auto-reload on changes (for development)
-def watch_and_run(filepath: str, debug=False):
+def watch_and_run(filepath: str, debug=False, debounce_seconds: float = 0.2):
     """
     Watches file for changes, auto recompiles and reruns.
     Requires watchdog or similar file watching package.
+
+    Bursts of modify events (editors often write a file in several syscalls
+    per save) are collapsed into a single re-run once `debounce_seconds`
+    have passed without a new event.
     """
     try:
         from watchdog.observers import Observer
-        from watchdog.events import FileSystemEventHandler
+        from watchdog.events import PatternMatchingEventHandler
     except ImportError:
         print("Watch mode requires watchdog package. Install via pip.")
         return
 
-    class ReloadHandler(FileSystemEventHandler):
+    abs_path = os.path.abspath(filepath)
+
+    class ReloadHandler(PatternMatchingEventHandler):
+        def __init__(self):
+            # Only the watched file is matched; sibling files never reach on_modified
+            super().__init__(patterns=[abs_path], ignore_directories=True)
+            self._timer = None
+            self._timer_lock = threading.Lock()
+
+        def _rerun(self):
+            print(f"Detected changes in {filepath}, re-running...")
+            run_file(filepath, debug=debug)
+
         def on_modified(self, event):
-            if event.src_path == os.path.abspath(filepath):
-                print(f"Detected changes in {filepath}, re-running...")
-                run_file(filepath, debug=debug)
+            with self._timer_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(debounce_seconds, self._rerun)
+                self._timer.daemon = True
+                self._timer.start()
+
+        def cancel(self):
+            with self._timer_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
 
     observer = Observer()
     event_handler = ReloadHandler()
-    observer.schedule(event_handler, path=os.path.dirname(filepath) or ".", recursive=False)
+    observer.schedule(event_handler, path=os.path.dirname(abs_path), recursive=False)
     observer.start()
 
+    # Block on an event instead of spinning; watchdog delivers changes on its own thread
+    stop_event = threading.Event()
+
     try:
         print(f"Watching {filepath} for changes. Press Ctrl+C to stop.")
         run_file(filepath, debug=debug)  # Run first time
 
-        while True:
-            pass  # Keep running
+        stop_event.wait()
 
     except KeyboardInterrupt:
         print("Stopping watch mode...")
+        stop_event.set()
+        event_handler.cancel()
         observer.stop()
     observer.join()
 
@@ -3,31 +3,12 @@
 import sys
 import argparse
 import logging
-from helixlang.runtime import run_script, simulate_protein, export_model
-from helixlang.cli import repl
-from helixlang.plugins import load_plugins
+
+# Runtime, REPL and plugin modules are imported inside the commands that
+# need them, so `helix version` or `--help` never load the runtime.
 
 # Setup logger
 logger = logging.getLogger("helixlang.cli")
-def main():
-    # your CLI argument parsing and dispatch logic here
-    import argparse
-
-    parser = argparse.ArgumentParser(description="HelixLang CLI")
-    parser.add_argument("command", nargs="?", default="repl", help="Command to run (run, simulate, export, repl)")
-    parser.add_argument("--version", action="version", version="HelixLang 1.0")
-    args = parser.parse_args()
-
-    if args.command == "repl":
-        from cli.repl import repl_loop
-        repl_loop()
-    elif args.command == "run":
-        # your run logic here
-        pass
-    # Add other commands accordingly
-
-    # For demonstration, just print
-    print(f"Running command: {args.command}")
 
 def setup_logging(verbosity: int):
     level = logging.WARNING  # default
@@ -38,6 +19,8 @@ def setup_logging(verbosity: int):
     logging.basicConfig(format='[%(levelname)s] %(message)s', level=level)
 
 def cmd_run(args):
+    from helixlang.runtime import run_script
+
     logger.info(f"Running HelixLang script: {args.file}")
     try:
         result = run_script(args.file)
@@ -51,6 +34,8 @@ def cmd_run(args):
         sys.exit(1)
 
 def cmd_simulate(args):
+    from helixlang.runtime import simulate_protein
+
     logger.info(f"Running simulation on protein: {args.protein}")
     try:
         result = simulate_protein(args.protein, duration=args.duration)
@@ -64,6 +49,8 @@ def cmd_simulate(args):
         sys.exit(1)
 
 def cmd_export(args):
+    from helixlang.runtime import run_script, export_model
+
     logger.info(f"Exporting model from {args.file} as {args.format}")
     try:
         model = run_script(args.file)  # Or a dedicated loader
@@ -74,6 +61,8 @@ def cmd_export(args):
         sys.exit(1)
 
 def cmd_repl(args):
+    from helixlang.cli import repl
+
     logger.info("Launching HelixLang interactive shell...")
     try:
         repl.start_shell()
@@ -84,7 +73,7 @@ def cmd_repl(args):
 def cmd_version(args):
     print("HelixLang version 1.0.0")
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="HelixLang CLI - Biological Programming Language"
     )
@@ -120,13 +109,22 @@ def main():
     parser_version = subparsers.add_parser("version", help="Show version info")
     parser_version.set_defaults(func=cmd_version)
 
+    return parser
+
+
+# Built once at import; main() only has to parse
+_PARSER = build_parser()
+
+
+def main(argv=None):
     # Load plugins if any (example, no-op if none)
+    from helixlang.plugins import load_plugins
     load_plugins()
 
-    args = parser.parse_args()
+    args = _PARSER.parse_args(argv)
 
     if args.command is None:
-        parser.print_help()
+        _PARSER.print_help()
         sys.exit(1)
 
     setup_logging(args.verbose)
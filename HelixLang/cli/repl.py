@@ -1,7 +1,8 @@
 # helixlang/cli/repl.py
 
+import io
+import logging
 import sys
-import traceback
 import code
 import readline
 from helixlang.runtime import eval_helix_code
@@ -21,14 +22,71 @@ Type 'help' for assistance, 'exit' or 'quit' to leave.
 PROMPT = "helix> "
 CONT_PROMPT = "...> "
 
+# Output is buffered between prompts and flushed before each input() call
+OUTPUT_BUFFER_SIZE = 65536
+
+# History is appended to disk every HISTORY_FLUSH_EVERY inputs so a killed
+# session keeps most of its history, not only on clean exit
+HISTORY_FILE = ".helixlang_history"
+HISTORY_LENGTH = 1000
+HISTORY_FLUSH_EVERY = 25
+
+logger = logging.getLogger("helixlang.cli")
+
 # Initialize REPL global state/context
 global_context = get_global_context()
 
+def _buffered_stdout():
+    """
+    Wrap the process stdout in a large write buffer so the many small
+    print() calls of one REPL iteration reach the OS as a single write.
+    Returns None when stdout is not a terminal (piped, CI), so output keeps
+    appearing as it is produced, or has no binary buffer (e.g. captured in
+    tests).
+    """
+    raw = getattr(sys.stdout, "buffer", None)
+    if raw is None or not sys.stdout.isatty():
+        return None
+    sys.stdout.flush()
+    return io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=OUTPUT_BUFFER_SIZE),
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        write_through=False,
+    )
+
+
 def repl_loop():
+    original_stdout = sys.stdout
+    buffered = _buffered_stdout()
+    if buffered is not None:
+        sys.stdout = buffered
+    try:
+        _repl_loop()
+    finally:
+        if buffered is not None:
+            # Detach both layers so the real stdout is left open
+            buffered.detach().detach()
+            sys.stdout = original_stdout
+
+
+def _flush_history(count):
+    try:
+        readline.append_history_file(count, HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def _repl_loop():
     print(WELCOME_MSG)
     buffer = []
+    # History length at the last flush; readline skips empty lines (and
+    # records nothing when stdin is not a tty), so count actual entries
+    saved_history = readline.get_current_history_length()
 
     while True:
+        # Make prompts appear promptly with all pending output before them
+        sys.stdout.flush()
         try:
             if buffer:
                 line = input(CONT_PROMPT)
@@ -42,6 +100,11 @@ def repl_loop():
             buffer.clear()
             continue
 
+        history_length = readline.get_current_history_length()
+        if history_length - saved_history >= HISTORY_FLUSH_EVERY:
+            _flush_history(history_length - saved_history)
+            saved_history = history_length
+
         # Allow exit commands
         if line.strip() in {"exit", "quit"}:
             print("Bye!")
@@ -58,7 +121,8 @@ def repl_loop():
                 continue  # Input incomplete, prompt for more
         except Exception:
             # If parser error unrelated to incompleteness, show error
-            print(colorize("Syntax Error:\n" + traceback.format_exc(), COLOR_ERROR))
+            sys.stdout.flush()  # keep ordering with the logger's stderr output
+            logger.exception("Syntax Error")
             buffer.clear()
             continue
 
@@ -67,10 +131,10 @@ def repl_loop():
             result = eval_helix_code(source, context=global_context)
             if result is not None:
                 print(colorize(repr(result), COLOR_WARN))  # Output in yellow as a highlight
-        except Exception as e:
-            # Print colored traceback
-            tb = traceback.format_exc()
-            print(colorize(f"Error:\n{tb}", COLOR_ERROR))
+        except Exception:
+            # Traceback is formatted by the logger, only when the record is emitted
+            sys.stdout.flush()  # keep ordering with the logger's stderr output
+            logger.exception("Error")
         finally:
             buffer.clear()
 
@@ -83,17 +147,22 @@ def start_shell():
         pass
 
     # Load history file if desired, e.g., ~/.helixlang_history
+    readline.set_history_length(HISTORY_LENGTH)
     try:
-        readline.read_history_file(".helixlang_history")
+        readline.read_history_file(HISTORY_FILE)
     except FileNotFoundError:
-        pass
+        # append_history_file needs an existing file
+        try:
+            open(HISTORY_FILE, "wb").close()
+        except OSError:
+            pass
 
     try:
         repl_loop()
     finally:
-        # Save history on exit
+        # Save history on exit (also trims the file to HISTORY_LENGTH)
         try:
-            readline.write_history_file(".helixlang_history")
+            readline.write_history_file(HISTORY_FILE)
         except Exception:
             pass
 
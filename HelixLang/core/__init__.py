@@ -10,27 +10,49 @@ Example usage:
     from helixlang.core import Parser, Tokenizer, Interpreter
 """
 
+import importlib
+
 # Optionally, define the core package version here or import from version.py
 try:
     from .version import __version__
 except ImportError:
     __version__ = "0.1.0"  # fallback version if version.py is missing
 
-# Import key components to expose them at the package level
-from .parser import Parser
-from .tokenizer import Tokenizer
-from .interpreter import Interpreter
-from .compiler import Compiler
-from .runtime import Runtime
-from .types import TypeSystem
-from .symbols import SymbolTable
-from .errors import (
-    SyntaxError as HelixSyntaxError,
-    TypeError as HelixTypeError,
-    RuntimeError as HelixRuntimeError,
-)
-from .optimizer import Optimizer
-from .validator import Validator
+# Key components are exposed at the package level but imported lazily
+# (PEP 562), so importing the package for __version__ or a single class
+# does not load the whole compiler/runtime import graph.
+
+# public name -> (submodule, attribute)
+_LAZY_ATTRS = {
+    "Parser": ("parser", "Parser"),
+    "Tokenizer": ("tokenizer", "Tokenizer"),
+    "Interpreter": ("interpreter", "Interpreter"),
+    "Resolver": ("resolver", "Resolver"),
+    "Compiler": ("compiler", "Compiler"),
+    "Runtime": ("runtime", "Runtime"),
+    "TypeSystem": ("types", "TypeSystem"),
+    "SymbolTable": ("symbols", "SymbolTable"),
+    "HelixSyntaxError": ("errors", "HelixSyntaxError"),
+    "HelixTypeError": ("errors", "HelixTypeError"),
+    "HelixRuntimeError": ("errors", "HelixRuntimeError"),
+    "Optimizer": ("optimizer", "Optimizer"),
+    "Validator": ("validator", "Validator"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, attr)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 # Optional: initialize any package-wide state here
 # (Avoid this if not strictly necessary to prevent tight coupling)
@@ -39,6 +61,7 @@ __all__ = [
     "Parser",
     "Tokenizer",
     "Interpreter",
+    "Resolver",
     "Compiler",
     "Runtime",
     "TypeSystem",
@@ -1,15 +1,100 @@
+import sys
 from abc import ABC, abstractmethod
+from enum import IntEnum
+
+
+# Operator opcodes. Operator strings are mapped to an Op once, when the
+# node is built, so later passes (compiler, interpreter) can dispatch on
+# an int instead of comparing strings.
+class Op(IntEnum):
+    # Binary arithmetic
+    ADD = 0
+    SUB = 1
+    MUL = 2
+    DIV = 3
+    MOD = 4
+    # Comparison
+    EQ = 5
+    NE = 6
+    LT = 7
+    LE = 8
+    GT = 9
+    GE = 10
+    # Logical
+    AND = 11
+    OR = 12
+    # Unary
+    NEG = 13
+    NOT = 14
+
+
+# Operator symbol -> opcode, for BinaryOpNode
+BINARY_OPCODES = {
+    '+': Op.ADD,
+    '-': Op.SUB,
+    '*': Op.MUL,
+    '/': Op.DIV,
+    '%': Op.MOD,
+    '==': Op.EQ,
+    '!=': Op.NE,
+    '<': Op.LT,
+    '<=': Op.LE,
+    '>': Op.GT,
+    '>=': Op.GE,
+    '&&': Op.AND,
+    '||': Op.OR,
+}
+
+# Operator symbol -> opcode, for UnaryOpNode
+UNARY_OPCODES = {
+    '-': Op.NEG,
+    '!': Op.NOT,
+}
+
+
+# Node kind tags, one per concrete node class (ASTNode._kind)
+KIND_NONE = 0
+KIND_BINARY_OP = 1
+KIND_UNARY_OP = 2
+KIND_LITERAL = 3
+KIND_VARIABLE = 4
+KIND_CALL = 5
+KIND_IF = 6
+KIND_WHILE = 7
+KIND_FOR = 8
+KIND_RETURN = 9
+KIND_BLOCK = 10
+KIND_FUNCTION_DEF = 11
+KIND_VARIABLE_DECL = 12
+KIND_ASSIGNMENT = 13
+KIND_STRUCT_DEF = 14
+KIND_IMPORT = 15
 
 
 class ASTNode(ABC):
     """
     Base class for all AST nodes.
     Stores source position info (line, column) for error reporting/debugging.
+
+    Every node class declares __slots__ so instances carry no per-instance
+    __dict__; subclasses must list the attributes they add.
+
+    The string form is built once by _format() and cached; code that
+    rewrites a node in place after printing it should call invalidate_str().
+
+    Concrete node classes set _visit_name to the visitor method accept()
+    calls, so visitors can build a type(node) -> method table up front
+    (see ASTVisitor.build_dispatch), and _kind to their KIND_* tag, which
+    passes compare instead of calling isinstance().
     """
 
+    __slots__ = ('line', 'column', '_str')
+    _kind = KIND_NONE
+
     def __init__(self, line: int, column: int):
         self.line = line
         self.column = column
+        self._str = None
 
     @abstractmethod
     def accept(self, visitor):
@@ -20,48 +105,75 @@ class ASTNode(ABC):
         pass
 
     @abstractmethod
-    def __str__(self):
+    def _format(self) -> str:
         """
-        Human-readable representation for debugging.
+        Build the human-readable representation for debugging.
         """
         pass
 
+    def __str__(self):
+        if self._str is None:
+            self._str = self._format()
+        return self._str
+
+    def invalidate_str(self):
+        """
+        Drop the cached string form, e.g. after a child was replaced.
+        """
+        self._str = None
+
 
 # === Expression Nodes ===
 
 class ExprNode(ASTNode):
     """Base class for all expressions."""
-    pass
+    __slots__ = ()
 
 
 class BinaryOpNode(ExprNode):
+    __slots__ = ('left', 'operator', 'right', 'op', 'compiled')
+    _visit_name = 'visit_binary_op'
+    _kind = KIND_BINARY_OP
+
     def __init__(self, left: ExprNode, operator: str, right: ExprNode, line: int, column: int):
         super().__init__(line, column)
         self.left = left
         self.operator = operator  # e.g., '+', '-', '*', '/'
         self.right = right
+        self.op = BINARY_OPCODES.get(operator)  # Op code, None if unknown
+        self.compiled = None  # interpreter closure, built on first evaluation
 
     def accept(self, visitor):
         return visitor.visit_binary_op(self)
 
-    def __str__(self):
+    def _format(self):
         return f"({self.left} {self.operator} {self.right})"
 
 
 class UnaryOpNode(ExprNode):
+    __slots__ = ('operator', 'operand', 'op', 'compiled')
+    _visit_name = 'visit_unary_op'
+    _kind = KIND_UNARY_OP
+
     def __init__(self, operator: str, operand: ExprNode, line: int, column: int):
         super().__init__(line, column)
         self.operator = operator  # e.g., '-', '!'
         self.operand = operand
+        self.op = UNARY_OPCODES.get(operator)  # Op code, None if unknown
+        self.compiled = None  # interpreter closure, built on first evaluation
 
     def accept(self, visitor):
         return visitor.visit_unary_op(self)
 
-    def __str__(self):
+    def _format(self):
         return f"({self.operator}{self.operand})"
 
 
 class LiteralNode(ExprNode):
+    __slots__ = ('value',)
+    _visit_name = 'visit_literal'
+    _kind = KIND_LITERAL
+
     def __init__(self, value, line: int, column: int):
         super().__init__(line, column)
         self.value = value  # Can be int, float, str, bool, etc.
@@ -69,23 +181,34 @@ class LiteralNode(ExprNode):
     def accept(self, visitor):
         return visitor.visit_literal(self)
 
-    def __str__(self):
+    def _format(self):
         return repr(self.value)
 
 
 class VariableNode(ExprNode):
+    __slots__ = ('name', 'depth', 'slot')
+    _visit_name = 'visit_variable'
+    _kind = KIND_VARIABLE
+
     def __init__(self, name: str, line: int, column: int):
         super().__init__(line, column)
-        self.name = name
+        self.name = sys.intern(name)  # identifiers repeat; share one string object
+        # Set by the resolver: scopes to walk up and slot index, None for globals
+        self.depth = None
+        self.slot = None
 
     def accept(self, visitor):
         return visitor.visit_variable(self)
 
-    def __str__(self):
+    def _format(self):
         return self.name
 
 
 class CallNode(ExprNode):
+    __slots__ = ('callee', 'arguments')
+    _visit_name = 'visit_call'
+    _kind = KIND_CALL
+
     def __init__(self, callee: ExprNode, arguments: list, line: int, column: int):
         super().__init__(line, column)
         self.callee = callee         # Expression identifying the function
@@ -94,7 +217,7 @@ class CallNode(ExprNode):
     def accept(self, visitor):
         return visitor.visit_call(self)
 
-    def __str__(self):
+    def _format(self):
         args_str = ', '.join(str(arg) for arg in self.arguments)
         return f"{self.callee}({args_str})"
 
@@ -103,10 +226,14 @@ class CallNode(ExprNode):
 
 class StmtNode(ASTNode):
     """Base class for all statements."""
-    pass
+    __slots__ = ()
 
 
 class IfNode(StmtNode):
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+    _visit_name = 'visit_if'
+    _kind = KIND_IF
+
     def __init__(self, condition: ExprNode, then_branch: StmtNode, else_branch: StmtNode = None, line: int = 0, column: int = 0):
         super().__init__(line, column)
         self.condition = condition
@@ -116,7 +243,7 @@ class IfNode(StmtNode):
     def accept(self, visitor):
         return visitor.visit_if(self)
 
-    def __str__(self):
+    def _format(self):
         s = f"if ({self.condition}) {self.then_branch}"
         if self.else_branch:
             s += f" else {self.else_branch}"
@@ -124,6 +251,10 @@ class IfNode(StmtNode):
 
 
 class WhileNode(StmtNode):
+    __slots__ = ('condition', 'body')
+    _visit_name = 'visit_while'
+    _kind = KIND_WHILE
+
     def __init__(self, condition: ExprNode, body: StmtNode, line: int, column: int):
         super().__init__(line, column)
         self.condition = condition
@@ -132,26 +263,36 @@ class WhileNode(StmtNode):
     def accept(self, visitor):
         return visitor.visit_while(self)
 
-    def __str__(self):
+    def _format(self):
         return f"while ({self.condition}) {self.body}"
 
 
 class ForNode(StmtNode):
+    __slots__ = ('initializer', 'condition', 'increment', 'body', 'scope_size', 'counted')
+    _visit_name = 'visit_for'
+    _kind = KIND_FOR
+
     def __init__(self, initializer: StmtNode, condition: ExprNode, increment: StmtNode, body: StmtNode, line: int, column: int):
         super().__init__(line, column)
         self.initializer = initializer
         self.condition = condition
         self.increment = increment
         self.body = body
+        self.scope_size = 0  # local slots in the loop scope, set by the resolver
+        self.counted = None  # interpreter's counted-loop plan, False if not applicable
 
     def accept(self, visitor):
         return visitor.visit_for(self)
 
-    def __str__(self):
+    def _format(self):
         return f"for ({self.initializer}; {self.condition}; {self.increment}) {self.body}"
 
 
 class ReturnNode(StmtNode):
+    __slots__ = ('value',)
+    _visit_name = 'visit_return'
+    _kind = KIND_RETURN
+
     def __init__(self, value: ExprNode, line: int, column: int):
         super().__init__(line, column)
         self.value = value  # Can be None for void return
@@ -159,52 +300,75 @@ class ReturnNode(StmtNode):
     def accept(self, visitor):
         return visitor.visit_return(self)
 
-    def __str__(self):
+    def _format(self):
         return f"return {self.value}" if self.value else "return"
 
 
 class BlockNode(StmtNode):
+    __slots__ = ('statements', 'scope_size')
+    _visit_name = 'visit_block'
+    _kind = KIND_BLOCK
+
     def __init__(self, statements: list, line: int, column: int):
         super().__init__(line, column)
         self.statements = statements  # List of StmtNode
+        self.scope_size = 0  # local slots in the block scope, set by the resolver
 
     def accept(self, visitor):
         return visitor.visit_block(self)
 
-    def __str__(self):
+    def _format(self):
         stmts_str = '\n'.join(str(stmt) for stmt in self.statements)
         return f"{{\n{stmts_str}\n}}"
 
 
 class FunctionDefNode(StmtNode):
+    __slots__ = ('name', 'params', 'body', 'slot', 'local_names', 'local_count', 'compiled')
+    _visit_name = 'visit_function_def'
+    _kind = KIND_FUNCTION_DEF
+
     def __init__(self, name: str, params: list, body: BlockNode, line: int, column: int):
         super().__init__(line, column)
-        self.name = name
-        self.params = params        # List of parameter names (strings)
+        self.name = sys.intern(name)
+        self.params = [sys.intern(p) for p in params]  # List of parameter names (strings)
         self.body = body
+        self.slot = None  # local slot of the function name, None for globals
+        # Call frame layout (parameters, then body locals), set by the resolver
+        self.local_names = tuple(self.params)
+        self.local_count = len(self.params)
+        self.compiled = None  # interpreter's compiled body, built on first call
 
     def accept(self, visitor):
         return visitor.visit_function_def(self)
 
-    def __str__(self):
+    def _format(self):
         params_str = ', '.join(self.params)
         return f"fn {self.name}({params_str}) {self.body}"
 
 
 class VariableDeclNode(StmtNode):
+    __slots__ = ('name', 'initializer', 'slot')
+    _visit_name = 'visit_variable_decl'
+    _kind = KIND_VARIABLE_DECL
+
     def __init__(self, name: str, initializer: ExprNode, line: int, column: int):
         super().__init__(line, column)
-        self.name = name
+        self.name = sys.intern(name)
         self.initializer = initializer
+        self.slot = None  # local slot, None for globals
 
     def accept(self, visitor):
         return visitor.visit_variable_decl(self)
 
-    def __str__(self):
+    def _format(self):
         return f"let {self.name} = {self.initializer};"
 
 
 class AssignmentNode(StmtNode):
+    __slots__ = ('target', 'value')
+    _visit_name = 'visit_assignment'
+    _kind = KIND_ASSIGNMENT
+
     def __init__(self, target: VariableNode, value: ExprNode, line: int, column: int):
         super().__init__(line, column)
         self.target = target
@@ -213,38 +377,47 @@ class AssignmentNode(StmtNode):
     def accept(self, visitor):
         return visitor.visit_assignment(self)
 
-    def __str__(self):
+    def _format(self):
         return f"{self.target} = {self.value};"
 
 
 # === Specialized Nodes ===
 
 class StructDefNode(StmtNode):
+    __slots__ = ('name', 'fields', 'slot')
+    _visit_name = 'visit_struct_def'
+    _kind = KIND_STRUCT_DEF
+
     def __init__(self, name: str, fields: list, line: int, column: int):
         """
         fields: list of tuples (field_name: str, field_type: str or None)
         """
         super().__init__(line, column)
-        self.name = name
-        self.fields = fields
+        self.name = sys.intern(name)
+        self.fields = [(sys.intern(field_name), typ) for field_name, typ in fields]
+        self.slot = None  # local slot, None for globals
 
     def accept(self, visitor):
         return visitor.visit_struct_def(self)
 
-    def __str__(self):
+    def _format(self):
         fields_str = ', '.join(f"{name}: {typ}" if typ else name for name, typ in self.fields)
         return f"struct {self.name} {{ {fields_str} }}"
 
 
 class ImportNode(StmtNode):
+    __slots__ = ('module_name',)
+    _visit_name = 'visit_import'
+    _kind = KIND_IMPORT
+
     def __init__(self, module_name: str, line: int, column: int):
         super().__init__(line, column)
-        self.module_name = module_name
+        self.module_name = sys.intern(module_name)
 
     def accept(self, visitor):
         return visitor.visit_import(self)
 
-    def __str__(self):
+    def _format(self):
         return f"import {self.module_name};"
 
 
@@ -255,6 +428,22 @@ class ASTVisitor(ABC):
     Example visitor interface to be implemented by interpreter/compiler/transformers.
     """
 
+    def build_dispatch(self) -> dict:
+        """
+        Map every concrete node class to this visitor's bound visit method.
+        Hot visitors call self._dispatch[type(node)](node) instead of
+        node.accept(self), skipping the accept() frame and attribute lookup.
+        """
+        dispatch = {}
+        pending = [ASTNode]
+        while pending:
+            cls = pending.pop()
+            pending.extend(cls.__subclasses__())
+            visit_name = cls.__dict__.get('_visit_name')
+            if visit_name is not None:
+                dispatch[cls] = getattr(self, visit_name)
+        return dispatch
+
     @abstractmethod
     def visit_binary_op(self, node: BinaryOpNode):
         pass
@@ -1,137 +1,439 @@
 # compiler.py
 
+import logging
+import os
+import threading
+from typing import Any, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from ast_nodes import *
 import ir_nodes as ir
 
+logger = logging.getLogger("helixlang.compiler")
+
+
+# Child expressions of each expression node, in evaluation order
+def _no_children(node):
+    return ()
+
+def _binary_children(node: BinaryOpNode):
+    return (node.left, node.right)
+
+def _unary_children(node: UnaryOpNode):
+    return (node.operand,)
+
+def _call_children(node: CallNode):
+    return node.arguments
+
+
+class NodeCounter(ASTVisitor):
+    """
+    Counts the nodes of an AST in one iterative pass.
+    Each visit_* method returns the node's direct children.
+    """
+
+    def count(self, root: ASTNode) -> int:
+        total = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            total += 1
+            stack.extend(node.accept(self))
+        return total
+
+    def visit_literal(self, node: LiteralNode):
+        return ()
+
+    def visit_variable(self, node: VariableNode):
+        return ()
+
+    def visit_binary_op(self, node: BinaryOpNode):
+        return (node.left, node.right)
+
+    def visit_unary_op(self, node: UnaryOpNode):
+        return (node.operand,)
+
+    def visit_call(self, node: CallNode):
+        return node.arguments
+
+    def visit_variable_decl(self, node: VariableDeclNode):
+        return (node.initializer,)
+
+    def visit_assignment(self, node: AssignmentNode):
+        return (node.value,)
+
+    def visit_block(self, node: BlockNode):
+        return node.statements
+
+    def visit_if(self, node: IfNode):
+        return (node.condition, node.then_branch, node.else_branch)
+
+    def visit_while(self, node: WhileNode):
+        return (node.condition, node.body)
+
+    def visit_for(self, node: ForNode):
+        return (node.initializer, node.condition, node.increment, node.body)
+
+    def visit_return(self, node: ReturnNode):
+        return (node.value,)
+
+    def visit_function_def(self, node: FunctionDefNode):
+        return (node.body,)
+
+    def visit_struct_def(self, node: StructDefNode):
+        return ()
+
+    def visit_import(self, node: ImportNode):
+        return ()
+
+
+# Top-level function bodies are compiled in worker processes once they add up
+# to at least this many AST nodes. Shipping a body to a worker and its IR back
+# costs about as much per node as compiling it, so only large programs on
+# more than one CPU gain anything.
+PARALLEL_MIN_NODES = 50_000 if (os.cpu_count() or 1) > 1 else float("inf")
+
+# Worker pool shared by every Compiler, started on first use
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor()
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    # A broken pool rejects every later submission; the next use starts a new one
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+# Idle Compiler instances reused for function bodies, so each function
+# definition does not rebuild the dispatch tables of a brand-new compiler.
+# Nested definitions simply take another instance from the list.
+_compiler_pool: List["Compiler"] = []
+
+
+def _compile_function_body(node: FunctionDefNode, label_scope: str) -> List[Any]:
+    # Module-level so it can be pickled into worker processes. pop() is
+    # atomic, so threads compiling concurrently never share an instance.
+    try:
+        compiler = _compiler_pool.pop()
+    except IndexError:
+        compiler = Compiler()
+    try:
+        compiler.reset(label_scope)
+        return compiler.compile_function(node)
+    finally:
+        compiler.reset()
+        _compiler_pool.append(compiler)
+
+
 class Compiler(ASTVisitor):
-    def __init__(self):
+    def __init__(self, label_scope: str = ""):
+        self.label_scope = label_scope  # prefix that keeps labels unique per function
+        self._precompiled = {}  # id(FunctionDefNode) -> body compiled by a worker
         self.instructions = []
+        self._ip = 0  # next free slot in self.instructions
         self.current_reg = 0
         self.label_count = 0
         self.function_bodies = {}  # name -> list of IR instructions
         self.current_function = None
 
-    # Helper to generate fresh virtual registers
-    def new_reg(self):
-        reg = f"r{self.current_reg}"
+        # Expression node type -> (children getter, emitter taking child registers)
+        self._expr_dispatch = {
+            LiteralNode: (_no_children, self._emit_literal),
+            VariableNode: (_no_children, self._emit_variable),
+            BinaryOpNode: (_binary_children, self._emit_binary_op),
+            UnaryOpNode: (_unary_children, self._emit_unary_op),
+            CallNode: (_call_children, self._emit_call),
+        }
+
+        # Unary opcode -> emitter(dest_reg, operand_reg)
+        self._unary_emitters = {
+            Op.NEG: self._emit_neg,
+            Op.NOT: self._emit_not,
+        }
+
+    # Helper to generate fresh virtual registers.
+    # Registers are plain ints so the IR and runtime can index a flat
+    # register list; use reg_name() when printing them.
+    def new_reg(self) -> int:
+        reg = self.current_reg
         self.current_reg += 1
         return reg
 
+    @staticmethod
+    def reg_name(reg: int) -> str:
+        return f"r{reg}"
+
     # Helper to generate unique labels
-    def new_label(self, prefix="L"):
-        label = f"{prefix}{self.label_count}"
+    def new_label(self, prefix: str = "L") -> str:
+        label = f"{self.label_scope}{prefix}{self.label_count}"
         self.label_count += 1
         return label
 
-    # Entry point
-    def compile(self, node: ASTNode):
-        self.instructions.clear()
+    # Helpers for the pre-sized instruction buffer.
+    # The AST node count is a cheap estimate of the instruction count, so the
+    # buffer is sized from it up front; _emit falls back to append past the end.
+    def _reserve(self, node: ASTNode) -> int:
+        """Size the buffer for `node`; returns its node count."""
+        count = NodeCounter().count(node)
+        self.instructions = [None] * count
+        self._ip = 0
+        return count
+
+    def _emit(self, instruction) -> None:
+        ip = self._ip
+        if ip < len(self.instructions):
+            self.instructions[ip] = instruction
+        else:
+            self.instructions.append(instruction)
+        self._ip = ip + 1
+
+    def _take_instructions(self) -> List[Any]:
+        # Drop unused reserved slots
+        del self.instructions[self._ip:]
+        return self.instructions
+
+    def reset(self, label_scope: str = "") -> None:
+        """
+        Return the compiler to its freshly constructed state so the instance
+        (and its dispatch tables) can be reused for another compile.
+        The previous instruction list is handed off, not cleared.
+        """
+        self.label_scope = label_scope
+        self._precompiled = {}
+        self.instructions = []
+        self._ip = 0
         self.current_reg = 0
         self.label_count = 0
+        self.function_bodies.clear()
         self.current_function = None
 
+    # Entry point
+    def compile(self, node: ASTNode) -> List[Any]:
+        self.reset(self.label_scope)
+        node_count = self._reserve(node)
+        if node_count >= PARALLEL_MIN_NODES:
+            self._precompiled = self._compile_functions_parallel(node)
+
         node.accept(self)
+        self._precompiled = {}
 
         # Optionally run optimizer here:
         # self.instructions = optimizer.optimize(self.instructions)
 
-        return self.instructions
+        return self._take_instructions()
 
-    # --- Expressions ---
+    def compile_function(self, node: FunctionDefNode) -> List[Any]:
+        """
+        Compile a function body on its own, with registers and labels
+        numbered from zero (labels are kept unique by self.label_scope).
+        """
+        self.reset(self.label_scope)
+        self._reserve(node.body)
+        self.current_function = node.name
 
-    def visit_literal(self, node: LiteralNode):
+        node.body.accept(self)
+
+        return self._take_instructions()
+
+    def _function_label_scope(self, node: FunctionDefNode) -> str:
+        return f"{self.label_scope}{node.name}."
+
+    def _compile_functions_parallel(self, root: ASTNode) -> Dict[int, List[Any]]:
+        """
+        Compile the bodies of top-level function definitions in the shared
+        process pool. Each body is independent of the outer program, so the
+        results are simply looked up again, in source order, by
+        visit_function_def.
+        Returns {} when the bodies are too small in total (see
+        PARALLEL_MIN_NODES) or the pool fails for any reason (no processes,
+        an AST that cannot be pickled: too deep, or carrying the
+        interpreter's cached closures, ...); visit_function_def then
+        compiles every body in this process as before.
+        """
+        if not isinstance(root, BlockNode):
+            return {}
+        funcs = [stmt for stmt in root.statements if isinstance(stmt, FunctionDefNode)]
+        if len(funcs) < 2:
+            return {}
+        counter = NodeCounter()
+        if sum(counter.count(f.body) for f in funcs) < PARALLEL_MIN_NODES:
+            return {}
+        scopes = [self._function_label_scope(f) for f in funcs]
+        pool = None
+        try:
+            pool = _get_process_pool()
+            bodies = list(pool.map(_compile_function_body, funcs, scopes))
+        except Exception as e:  # includes RecursionError from pickling deep trees
+            if pool is not None and isinstance(e, BrokenProcessPool):
+                _discard_process_pool(pool)
+            logger.debug("Compiling %d function bodies in-process, worker pool failed: %r",
+                         len(funcs), e)
+            return {}
+        return {id(f): body for f, body in zip(funcs, bodies)}
+
+    # --- Expressions ---
+    #
+    # Expression trees are compiled with an explicit post-order worklist
+    # rather than recursive accept() calls, so long operator chains do not
+    # hit the recursion limit. The visit_* methods are kept as entry points.
+
+    def compile_expression(self, root: ExprNode) -> int:
+        """
+        Compile an expression tree iteratively and return its result register.
+        """
+        dispatch = self._expr_dispatch
+        results = []              # registers of already-compiled subexpressions
+        stack = [(root, -1)]      # (node, child count once children are queued; -1 before)
+
+        while stack:
+            node, child_count = stack.pop()
+            entry = dispatch.get(type(node))
+            if entry is None:
+                # Not a known expression node; defer to its own visitor
+                results.append(node.accept(self))
+                continue
+
+            children_of, emit = entry
+            if child_count < 0:
+                children = children_of(node)
+                stack.append((node, len(children)))
+                for child in reversed(children):
+                    stack.append((child, -1))
+                continue
+
+            if child_count:
+                child_regs = results[-child_count:]
+                del results[-child_count:]
+            else:
+                child_regs = []
+            results.append(emit(node, child_regs))
+
+        return results[-1]
+
+    def visit_literal(self, node: LiteralNode) -> int:
+        return self.compile_expression(node)
+
+    def visit_variable(self, node: VariableNode) -> int:
+        return self.compile_expression(node)
+
+    def visit_binary_op(self, node: BinaryOpNode) -> int:
+        return self.compile_expression(node)
+
+    def visit_unary_op(self, node: UnaryOpNode) -> int:
+        return self.compile_expression(node)
+
+    def visit_call(self, node: CallNode) -> int:
+        return self.compile_expression(node)
+
+    def _emit_literal(self, node: LiteralNode, child_regs: List[int]) -> int:
         reg = self.new_reg()
-        self.instructions.append(ir.IRLoadConst(reg, node.value))
+        self._emit(ir.IRLoadConst(reg, node.value))
         return reg
 
-    def visit_variable(self, node: VariableNode):
+    def _emit_variable(self, node: VariableNode, child_regs: List[int]) -> int:
         reg = self.new_reg()
-        self.instructions.append(ir.IRLoadVar(reg, node.name))
+        self._emit(ir.IRLoadVar(reg, node.name))
         return reg
 
-    def visit_binary_op(self, node: BinaryOpNode):
-        left_reg = node.left.accept(self)
-        right_reg = node.right.accept(self)
+    def _emit_binary_op(self, node: BinaryOpNode, child_regs: List[int]) -> int:
+        left_reg, right_reg = child_regs
         dest_reg = self.new_reg()
-        self.instructions.append(ir.IRBinaryOp(node.operator, dest_reg, left_reg, right_reg))
+        self._emit(ir.IRBinaryOp(node.operator, dest_reg, left_reg, right_reg))
         return dest_reg
 
-    def visit_unary_op(self, node: UnaryOpNode):
-        operand_reg = node.operand.accept(self)
-        dest_reg = self.new_reg()
-        # For simplicity: treat unary minus as binary 0 - operand
-        if node.operator == '-':
-            zero_reg = self.new_reg()
-            self.instructions.append(ir.IRLoadConst(zero_reg, 0))
-            self.instructions.append(ir.IRBinaryOp('-', dest_reg, zero_reg, operand_reg))
-        elif node.operator == '!':
-            # Could define a special IRUnaryOp, but let's fake with binary '==' to 0
-            zero_reg = self.new_reg()
-            self.instructions.append(ir.IRLoadConst(zero_reg, 0))
-            self.instructions.append(ir.IRBinaryOp('==', dest_reg, operand_reg, zero_reg))
-        else:
+    def _emit_unary_op(self, node: UnaryOpNode, child_regs: List[int]) -> int:
+        operand_reg, = child_regs
+        emitter = self._unary_emitters.get(node.op)
+        if emitter is None:
             raise Exception(f"Unknown unary operator {node.operator}")
+        dest_reg = self.new_reg()
+        emitter(dest_reg, operand_reg)
         return dest_reg
 
-    def visit_call(self, node: CallNode):
-        arg_regs = [arg.accept(self) for arg in node.arguments]
+    def _emit_neg(self, dest_reg: int, operand_reg: int) -> None:
+        # For simplicity: treat unary minus as binary 0 - operand
+        zero_reg = self.new_reg()
+        self._emit(ir.IRLoadConst(zero_reg, 0))
+        self._emit(ir.IRBinaryOp('-', dest_reg, zero_reg, operand_reg))
+
+    def _emit_not(self, dest_reg: int, operand_reg: int) -> None:
+        # Could define a special IRUnaryOp, but let's fake with binary '==' to 0
+        zero_reg = self.new_reg()
+        self._emit(ir.IRLoadConst(zero_reg, 0))
+        self._emit(ir.IRBinaryOp('==', dest_reg, operand_reg, zero_reg))
+
+    def _emit_call(self, node: CallNode, arg_regs: List[int]) -> int:
         dest_reg = self.new_reg()
         # Assuming function name is a VariableNode or a string
         if isinstance(node.callee, VariableNode):
             func_name = node.callee.name
         else:
             raise Exception("Complex callables not supported in this IR")
-        self.instructions.append(ir.IRCall(dest_reg, func_name, arg_regs))
+        self._emit(ir.IRCall(dest_reg, func_name, list(arg_regs)))
         return dest_reg
 
     # --- Statements ---
 
-    def visit_variable_decl(self, node: VariableDeclNode):
+    def visit_variable_decl(self, node: VariableDeclNode) -> None:
         if node.initializer:
             value_reg = node.initializer.accept(self)
-            self.instructions.append(ir.IRStoreVar(node.name, value_reg))
+            self._emit(ir.IRStoreVar(node.name, value_reg))
         else:
             # Initialize to None or 0 by default
             default_reg = self.new_reg()
-            self.instructions.append(ir.IRLoadConst(default_reg, None))
-            self.instructions.append(ir.IRStoreVar(node.name, default_reg))
+            self._emit(ir.IRLoadConst(default_reg, None))
+            self._emit(ir.IRStoreVar(node.name, default_reg))
 
-    def visit_assignment(self, node: AssignmentNode):
+    def visit_assignment(self, node: AssignmentNode) -> None:
         value_reg = node.value.accept(self)
-        self.instructions.append(ir.IRStoreVar(node.target.name, value_reg))
+        self._emit(ir.IRStoreVar(node.target.name, value_reg))
 
-    def visit_block(self, node: BlockNode):
+    def visit_block(self, node: BlockNode) -> None:
         for stmt in node.statements:
             stmt.accept(self)
 
-    def visit_if(self, node: IfNode):
+    def visit_if(self, node: IfNode) -> None:
         cond_reg = node.condition.accept(self)
         else_label = self.new_label("else")
         end_label = self.new_label("endif")
 
         # Jump to else if condition is false
-        self.instructions.append(ir.IRJumpIfFalse(cond_reg, else_label))
+        self._emit(ir.IRJumpIfFalse(cond_reg, else_label))
 
         node.then_branch.accept(self)
-        self.instructions.append(ir.IRJump(end_label))
+        self._emit(ir.IRJump(end_label))
 
-        self.instructions.append(ir.IRLabel(else_label))
+        self._emit(ir.IRLabel(else_label))
         if node.else_branch:
             node.else_branch.accept(self)
-        self.instructions.append(ir.IRLabel(end_label))
+        self._emit(ir.IRLabel(end_label))
 
-    def visit_while(self, node: WhileNode):
+    def visit_while(self, node: WhileNode) -> None:
         start_label = self.new_label("while_start")
         end_label = self.new_label("while_end")
 
-        self.instructions.append(ir.IRLabel(start_label))
+        self._emit(ir.IRLabel(start_label))
         cond_reg = node.condition.accept(self)
-        self.instructions.append(ir.IRJumpIfFalse(cond_reg, end_label))
+        self._emit(ir.IRJumpIfFalse(cond_reg, end_label))
         node.body.accept(self)
-        self.instructions.append(ir.IRJump(start_label))
-        self.instructions.append(ir.IRLabel(end_label))
+        self._emit(ir.IRJump(start_label))
+        self._emit(ir.IRLabel(end_label))
 
-    def visit_for(self, node: ForNode):
+    def visit_for(self, node: ForNode) -> None:
         self.push_scope()  # If scope management is implemented
 
         node.initializer.accept(self)
@@ -139,49 +441,44 @@ class Compiler(ASTVisitor):
         start_label = self.new_label("for_start")
         end_label = self.new_label("for_end")
 
-        self.instructions.append(ir.IRLabel(start_label))
+        self._emit(ir.IRLabel(start_label))
         cond_reg = node.condition.accept(self)
-        self.instructions.append(ir.IRJumpIfFalse(cond_reg, end_label))
+        self._emit(ir.IRJumpIfFalse(cond_reg, end_label))
 
         node.body.accept(self)
         node.increment.accept(self)
-        self.instructions.append(ir.IRJump(start_label))
-        self.instructions.append(ir.IRLabel(end_label))
+        self._emit(ir.IRJump(start_label))
+        self._emit(ir.IRLabel(end_label))
 
         self.pop_scope()
 
-    def visit_return(self, node: ReturnNode):
+    def visit_return(self, node: ReturnNode) -> None:
         if node.value:
             ret_reg = node.value.accept(self)
         else:
             ret_reg = None
-        self.instructions.append(ir.IRReturn(ret_reg))
-
-    def visit_function_def(self, node: FunctionDefNode):
-        # Compile function body into separate instruction list
-        saved_instructions = self.instructions
-        self.instructions = []
+        self._emit(ir.IRReturn(ret_reg))
 
-        self.current_function = node.name
-        node.body.accept(self)
-        body_instructions = self.instructions
-
-        self.instructions = saved_instructions
-        self.instructions.append(ir.IRFunctionDef(node.name, body_instructions))
-        self.current_function = None
+    def visit_function_def(self, node: FunctionDefNode) -> None:
+        # Compile function body into separate instruction list, using a fresh
+        # compiler so the body does not depend on the outer compile state
+        body_instructions = self._precompiled.pop(id(node), None)
+        if body_instructions is None:
+            body_instructions = _compile_function_body(node, self._function_label_scope(node))
+        self._emit(ir.IRFunctionDef(node.name, body_instructions))
 
-    def visit_struct_def(self, node: StructDefNode):
+    def visit_struct_def(self, node: StructDefNode) -> None:
         # For now, just generate a no-op or metadata instruction
-        self.instructions.append(ir.IRNoOp())
+        self._emit(ir.IRNoOp())
 
-    def visit_import(self, node: ImportNode):
+    def visit_import(self, node: ImportNode) -> None:
         # Imports might translate to special IR or be handled at runtime
-        self.instructions.append(ir.IRNoOp())
+        self._emit(ir.IRNoOp())
 
     # Optional scope management helpers
-    def push_scope(self):
+    def push_scope(self) -> None:
         # For variable scoping in IR if needed
         pass
 
-    def pop_scope(self):
+    def pop_scope(self) -> None:
         pass
@@ -2,8 +2,14 @@
 import os
 import json
 import argparse
+import functools
 from enum import Enum, auto
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson  # optional, faster JSON parsing
+except ImportError:
+    orjson = None
 
 
 class RuntimeMode(Enum):
@@ -22,10 +28,84 @@ class ConfigError(Exception):
     pass
 
 
+# Environment variables read by Config, as (variable name, config key).
+# Names are precomputed rather than built from a prefix on every load.
+_ENV_KEYS = (
+    ('HELIX_DEBUG_MODE', 'debug_mode'),
+    ('HELIX_OPT_LEVEL', 'optimization_level'),
+    ('HELIX_RUNTIME_MODE', 'runtime_mode'),
+    ('HELIX_LANGUAGE_DIALECT', 'language_dialect'),
+    ('HELIX_MAX_STACK_DEPTH', 'max_stack_depth'),
+    ('HELIX_ENABLE_GC', 'enable_gc'),
+    ('HELIX_LOG_LEVEL', 'log_level'),
+    ('HELIX_CONFIG_FILE_PATH', 'config_file_path'),
+)
+
+# Cached os.getenv results (None for unset variables), filled on first read
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _get_env_cached(name: str) -> Optional[str]:
+    try:
+        return _ENV_CACHE[name]
+    except KeyError:
+        value = _ENV_CACHE[name] = os.getenv(name)
+        return value
+
+
+# Parsed config files: path -> ((mtime_ns, size), data)
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _load_json_cached(path: str) -> Dict[str, Any]:
+    """
+    Parse a JSON config file, reusing the previous result while the file's
+    mtime and size are unchanged. Raises FileNotFoundError / json.JSONDecodeError.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    _FILE_CACHE[path] = (key, data)
+    return data
+
+
+# Allowed values for the CLI options, computed once
+_OPT_LEVEL_CHOICES = tuple(range(0, 4))
+_RUNTIME_CHOICES = tuple(m.value for m in RuntimeMode)
+_DIALECT_CHOICES = tuple(d.value for d in LanguageDialect)
+_LOG_LEVEL_CHOICES = ('DEBUG', 'INFO', 'WARN', 'ERROR')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cli_parser() -> argparse.ArgumentParser:
+    """
+    Build the config option parser once; reload() and later loads reuse it.
+    """
+    parser = argparse.ArgumentParser(description="HelixLang Configuration")
+
+    parser.add_argument('--debug', action='store_true', help="Enable debug mode")
+    parser.add_argument('--opt-level', type=int, choices=_OPT_LEVEL_CHOICES, help="Optimization level (0-3)")
+    parser.add_argument('--runtime', choices=_RUNTIME_CHOICES, help="Runtime mode")
+    parser.add_argument('--dialect', choices=_DIALECT_CHOICES, help="Language dialect/version")
+    parser.add_argument('--max-stack-depth', type=int, help="Maximum stack depth")
+    parser.add_argument('--enable-gc', type=bool, help="Enable garbage collection")
+    parser.add_argument('--log-level', choices=_LOG_LEVEL_CHOICES, help="Logging level")
+    parser.add_argument('--config-file', type=str, help="Path to config JSON file")
+    return parser
+
+
 class Config:
     """
     Global configuration manager for HelixLang.
-    Implements singleton pattern by storing a class-level instance.
+    The shared instance is obtained via get_config(); constructing Config()
+    directly gives an independent instance with freshly loaded sources.
 
     Supports loading config from:
     - Environment variables
@@ -35,8 +115,6 @@ class Config:
     Provides type-safe access with validation.
     """
 
-    _instance = None
-
     # Default configuration values
     _defaults = {
         'debug_mode': False,
@@ -49,12 +127,18 @@ class Config:
         'config_file_path': None,
     }
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._config = cls._defaults.copy()
-            cls._instance._load_sources()
-        return cls._instance
+    def __init__(self):
+        self._config = self._defaults.copy()
+        self._load_sources()
+
+    @staticmethod
+    def force_init() -> "Config":
+        """
+        Return the shared instance with all sources, including the command line, loaded.
+        """
+        instance = get_config()
+        instance._ensure_cli_loaded()
+        return instance
 
     def _load_sources(self):
         """
@@ -62,38 +146,39 @@ class Config:
         1. From config file (if specified)
         2. From environment variables
         3. From command line arguments
+
+        Command line arguments are parsed lazily, on the first read or write
+        of a value, so importing HelixLang as a library never runs argparse.
         """
         self._load_from_env()
         self._load_from_file()
-        self._load_from_cli()
+        self._cli_loaded = False
+
+    def _ensure_cli_loaded(self):
+        if not self._cli_loaded:
+            self._cli_loaded = True
+            self._load_from_cli()
 
     def _load_from_env(self):
-        # Prefix for environment variables
-        prefix = "HELIX_"
-
-        # Map env vars to config keys
-        env_map = {
-            'DEBUG_MODE': 'debug_mode',
-            'OPT_LEVEL': 'optimization_level',
-            'RUNTIME_MODE': 'runtime_mode',
-            'LANGUAGE_DIALECT': 'language_dialect',
-            'MAX_STACK_DEPTH': 'max_stack_depth',
-            'ENABLE_GC': 'enable_gc',
-            'LOG_LEVEL': 'log_level',
-            'CONFIG_FILE_PATH': 'config_file_path',
-        }
-
-        for env_key, config_key in env_map.items():
-            val = os.getenv(prefix + env_key)
+        # Environment reads are cached; see invalidate_env_cache()
+        for env_key, config_key in _ENV_KEYS:
+            val = _get_env_cached(env_key)
             if val is not None:
                 self._set_config_value(config_key, val, source="env")
 
+    @staticmethod
+    def invalidate_env_cache():
+        """
+        Forget cached environment variables, so the next load sees changes
+        made to os.environ since the first read. reload() calls this itself.
+        """
+        _ENV_CACHE.clear()
+
     def _load_from_file(self):
         path = self._config.get('config_file_path')
         if path:
             try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
+                data = _load_json_cached(path)
                 for key, val in data.items():
                     self._set_config_value(key, val, source=f"file:{path}")
             except FileNotFoundError:
@@ -103,18 +188,7 @@ class Config:
                 raise ConfigError(f"Invalid JSON in config file {path}: {e}")
 
     def _load_from_cli(self):
-        parser = argparse.ArgumentParser(description="HelixLang Configuration")
-
-        parser.add_argument('--debug', action='store_true', help="Enable debug mode")
-        parser.add_argument('--opt-level', type=int, choices=range(0,4), help="Optimization level (0-3)")
-        parser.add_argument('--runtime', choices=[m.value for m in RuntimeMode], help="Runtime mode")
-        parser.add_argument('--dialect', choices=[d.value for d in LanguageDialect], help="Language dialect/version")
-        parser.add_argument('--max-stack-depth', type=int, help="Maximum stack depth")
-        parser.add_argument('--enable-gc', type=bool, help="Enable garbage collection")
-        parser.add_argument('--log-level', choices=['DEBUG','INFO','WARN','ERROR'], help="Logging level")
-        parser.add_argument('--config-file', type=str, help="Path to config JSON file")
-
-        args, unknown = parser.parse_known_args()
+        args, unknown = _get_cli_parser().parse_known_args()
 
         # Override only if specified
         if args.debug:
@@ -168,6 +242,7 @@ class Config:
         """
         Get the value of a config key.
         """
+        self._ensure_cli_loaded()
         if key not in self._config:
             raise ConfigError(f"Config key '{key}' not found.")
         return self._config[key]
@@ -176,18 +251,21 @@ class Config:
         """
         Dynamically set a config key at runtime.
         """
+        self._ensure_cli_loaded()  # so a later CLI load cannot override this value
         self._set_config_value(key, value)
 
     def all(self) -> Dict[str, Any]:
         """
         Return all config values as a dictionary.
         """
+        self._ensure_cli_loaded()
         return self._config.copy()
 
     def reload(self):
         """
-        Reload config from all sources.
+        Reload config from all sources, re-reading the environment.
         """
+        self.invalidate_env_cache()
         self._config = self._defaults.copy()
         self._load_sources()
 
@@ -213,11 +291,33 @@ class Config:
         return iv
 
 
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Return the process-wide Config instance, constructing it on first call.
+    """
+    return Config()
+
+
+class _LazyConfig:
+    """
+    Stand-in for the shared Config that only constructs it (and loads
+    its sources) on first attribute access. Kept for legacy callers of
+    the module-level `config`; new code should call get_config().
+    """
+
+    def __getattr__(self, name):
+        return getattr(get_config(), name)
+
+    def __repr__(self):
+        return f"<lazy {Config.__name__}>"
+
+
 # Singleton instance accessible via this:
-config = Config()
+config = _LazyConfig()
 
 
 # Usage example:
-# from config import config
-# debug = config.get('debug_mode')
-# config.set('optimization_level', 3)
+# from config import get_config
+# debug = get_config().get('debug_mode')
+# get_config().set('optimization_level', 3)
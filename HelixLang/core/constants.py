@@ -9,13 +9,19 @@ and other fixed language constructs.
 
 These constants are heavily referenced by tokenizer.py, parser.py, interpreter.py,
 stdlib_loader.py, and other core modules.
+
+All tables are immutable (tuples, frozensets and read-only mapping
+proxies) so they can be shared and cached safely.
 """
 
+import sys
+from types import MappingProxyType
+
 # ---------------------------
 # Keywords
 # ---------------------------
 # Reserved words in HelixLang that have special syntactic or semantic meaning.
-KEYWORDS = [
+KEYWORDS = (
     # Control flow
     "if", "else", "elif", "while", "for", "break", "continue", "return",
 
@@ -46,16 +52,17 @@ KEYWORDS = [
 
     # Debug and runtime
     "debug", "assert",
-]
+)
 
-# Fast lookup for keywords (used by tokenizer)
-KEYWORDS_SET = set(KEYWORDS)
+# Fast lookup for keywords (used by tokenizer). Interned so lookups with
+# interned token text hit on identity; frozen so it is safe to share.
+KEYWORDS_SET = frozenset(sys.intern(k) for k in KEYWORDS)
 
 # ---------------------------
 # Operators
 # ---------------------------
 # All operator symbols supported by HelixLang
-OPERATORS = {
+OPERATORS = MappingProxyType({
     # Arithmetic
     "PLUS": "+",
     "MINUS": "-",
@@ -105,16 +112,21 @@ OPERATORS = {
     "RBRACE": "}",
     "LBRACKET": "[",
     "RBRACKET": "]",
-}
+})
 
 # Reverse mapping for quick token recognition (symbol -> token name)
-OPERATORS_REVERSE = {v: k for k, v in OPERATORS.items()}
+OPERATORS_REVERSE = MappingProxyType(
+    {sys.intern(v): sys.intern(k) for k, v in OPERATORS.items()}
+)
+
+# Every operator symbol, for quick "is this an operator?" checks
+OPERATOR_SYMBOLS = frozenset(OPERATORS_REVERSE)
 
 # ---------------------------
 # Built-in Functions
 # ---------------------------
 # Names of built-in functions that are always available in the standard environment
-BUILTIN_FUNCTIONS = [
+BUILTIN_FUNCTIONS = (
     "print",        # Output to console
     "println",      # Output with newline
     "len",          # Length of string, array, etc.
@@ -131,20 +143,20 @@ BUILTIN_FUNCTIONS = [
     "sin", "cos", "tan",  # Trigonometric
     "random",       # Random number generation
     "exit",         # Exit program
-]
+)
 
-BUILTIN_FUNCTIONS_SET = set(BUILTIN_FUNCTIONS)
+BUILTIN_FUNCTIONS_SET = frozenset(BUILTIN_FUNCTIONS)
 
 # ---------------------------
 # Literals
 # ---------------------------
 # Special predefined literal values in HelixLang
-LITERALS = {
+LITERALS = MappingProxyType({
     "NULL": "null",
     "TRUE": "true",
     "FALSE": "false",
     "NONE": "none",  # synonym for null or empty
-}
+})
 
 # ---------------------------
 # Miscellaneous
@@ -156,24 +168,24 @@ COMMENT_MULTI_START = "/*"
 COMMENT_MULTI_END = "*/"
 
 # Whitespace characters for tokenizer
-WHITESPACE_CHARS = {" ", "\t", "\n", "\r"}
+WHITESPACE_CHARS = frozenset({" ", "\t", "\n", "\r"})
 
 # Numeric literal prefixes (for bases)
-NUMERIC_PREFIXES = {
+NUMERIC_PREFIXES = MappingProxyType({
     "BINARY": "0b",
     "OCTAL": "0o",
     "HEX": "0x",
-}
+})
 
 # Escape sequences supported in string literals
-ESCAPE_SEQUENCES = {
+ESCAPE_SEQUENCES = MappingProxyType({
     "\\n": "\n",
     "\\t": "\t",
     "\\r": "\r",
     "\\\"": "\"",
     "\\'": "'",
     "\\\\": "\\",
-}
+})
 
 # File extensions for HelixLang source files
 FILE_EXTENSION = ".hl"
@@ -183,11 +195,11 @@ FILE_EXTENSION = ".hl"
 # ---------------------------
 
 # Language version tags
-LANGUAGE_VERSIONS = {
+LANGUAGE_VERSIONS = MappingProxyType({
     "1.0": "HelixLang v1.0 stable",
     "1.1": "HelixLang v1.1 experimental features",
     "2.0": "HelixLang future major release",
-}
+})
 
 # Default version used if none specified
 DEFAULT_LANGUAGE_VERSION = "1.0"
@@ -195,14 +207,14 @@ DEFAULT_LANGUAGE_VERSION = "1.0"
 # ---------------------------
 # Error codes (optional)
 # ---------------------------
-ERROR_CODES = {
+ERROR_CODES = MappingProxyType({
     "E_SYNTAX": 1001,
     "E_TYPE": 1002,
     "E_RUNTIME": 1003,
     "E_UNDEFINED_SYMBOL": 1004,
     "E_MUTATION": 1005,
     "E_DIVIDE_BY_ZERO": 1006,
-}
+})
 
 # ---------------------------
 # Usage Examples (for reference)
@@ -1,35 +1,346 @@
 # interpreter.py
 
+import operator
+
 from ast_nodes import *
+from resolver import Resolver
 from symbols import SymbolTable  # assumed symbol lookup helper
 from types import TypeChecker     # assumed runtime type checker
-from runtime import RuntimeError, ReturnException, Environment  # helpers
+from runtime import RuntimeError, Environment  # helpers
+
+# Binary operators dispatched by opcode (BinaryOpNode.op).
+# Arithmetic and ordering require numeric operands; equality accepts anything.
+_NUMERIC_BINOPS = {
+    Op.ADD: operator.add,
+    Op.SUB: operator.sub,
+    Op.MUL: operator.mul,
+    Op.DIV: operator.truediv,
+    Op.LT: operator.lt,
+    Op.LE: operator.le,
+    Op.GT: operator.gt,
+    Op.GE: operator.ge,
+}
+_GENERIC_BINOPS = {
+    Op.EQ: operator.eq,
+    Op.NE: operator.ne,
+}
+_NUMERIC_TYPES = (int, float)
+
+
+# --- Compiled expression closures ---
+#
+# Arithmetic-heavy programs spend most of their time in binary and unary
+# operators. The first time such a node is evaluated it is compiled into a
+# tree of closures taking the interpreter as their only argument, with
+# operands, opcodes and resolved variable slots bound as closure cells, so
+# later evaluations skip the dispatch table and node attribute reads.
+# Node kinds without a closure form fall back to the dispatch table.
+# Closures are cached on the node (`compiled`); code that rewrites an
+# operator node in place after it has run must reset that field.
+
+def _compile_expr(node: ExprNode):
+    compile_node = _EXPR_COMPILERS.get(type(node))
+    if compile_node is not None:
+        return compile_node(node)
+    node_type = type(node)
+    return lambda interp: interp._dispatch[node_type](node)
+
+
+def _compile_literal(node: LiteralNode):
+    value = node.value
+    return lambda interp: value
+
+
+def _compile_variable(node: VariableNode):
+    name, depth, slot = node.name, node.depth, node.slot
+    line, column = node.line, node.column
+
+    if depth is None:
+        def evaluate(interp):
+            value = interp.global_env.values.get(name)
+            if value is None:
+                raise RuntimeError(f"Undefined variable '{name}'", line, column)
+            return value
+    elif depth == 0:
+        def evaluate(interp):
+            value = interp.env.slots[slot]
+            if value is None:
+                raise RuntimeError(f"Undefined variable '{name}'", line, column)
+            return value
+    else:
+        def evaluate(interp):
+            env = interp.env
+            hops = depth
+            while hops:
+                env = env.parent
+                hops -= 1
+            value = env.slots[slot]
+            if value is None:
+                raise RuntimeError(f"Undefined variable '{name}'", line, column)
+            return value
+    return evaluate
+
+
+def _compile_binary_op(node: BinaryOpNode):
+    left = _compile_expr(node.left)
+    right = _compile_expr(node.right)
+    line, column = node.line, node.column
+
+    fn = _NUMERIC_BINOPS.get(node.op)
+    if fn is not None:
+        def evaluate(interp):
+            a = left(interp)
+            b = right(interp)
+            if not (isinstance(a, _NUMERIC_TYPES) and isinstance(b, _NUMERIC_TYPES)):
+                raise RuntimeError("Operands must be numeric", line, column)
+            try:
+                return fn(a, b)
+            except ZeroDivisionError:
+                raise RuntimeError("Division by zero", line, column) from None
+        return evaluate
+
+    fn = _GENERIC_BINOPS.get(node.op)
+    if fn is not None:
+        return lambda interp: fn(left(interp), right(interp))
+
+    # Short-circuit: the right operand is only evaluated when it decides the result
+    if node.op is Op.AND:
+        return lambda interp: (True if right(interp) else False) if left(interp) else False
+    if node.op is Op.OR:
+        return lambda interp: True if left(interp) else (True if right(interp) else False)
+
+    # Unknown operators keep the visitor's handling
+    return lambda interp: interp._eval_binary_op(node)
+
+
+def _compile_unary_op(node: UnaryOpNode):
+    operand = _compile_expr(node.operand)
+    line, column = node.line, node.column
+
+    if node.op is Op.NEG:
+        def evaluate(interp):
+            value = operand(interp)
+            if not isinstance(value, _NUMERIC_TYPES):
+                raise RuntimeError("Operands must be numeric", line, column)
+            return -value
+        return evaluate
+    if node.op is Op.NOT:
+        return lambda interp: not operand(interp)
+
+    return lambda interp: interp._eval_unary_op(node)
+
+
+_EXPR_COMPILERS = {
+    LiteralNode: _compile_literal,
+    VariableNode: _compile_variable,
+    BinaryOpNode: _compile_binary_op,
+    UnaryOpNode: _compile_unary_op,
+}
+
+
+# --- Compiled function bodies ---
+#
+# A function's top-level statements are compiled on its first call into a
+# flat tuple of closures with the same calling convention as the
+# expression closures, so later calls run the body without looking up a
+# visit method per statement. The tuple is cached on the FunctionDefNode
+# (`compiled`) and shared by every Function created from it. Declarations,
+# frame-local assignments and returns get their own forms; control flow
+# and other statements go through the dispatch table.
+
+def _compile_stmt(node: ASTNode):
+    compile_node = _STMT_COMPILERS.get(type(node))
+    if compile_node is not None:
+        return compile_node(node)
+    if isinstance(node, ExprNode):
+        return _compile_expr(node)  # expression statement; value discarded
+    node_type = type(node)
+    return lambda interp: interp._dispatch[node_type](node)
+
+
+def _compile_variable_decl(node: VariableDeclNode):
+    name, slot = node.name, node.slot
+    initializer = _compile_expr(node.initializer) if node.initializer else None
+
+    if slot is None:
+        if initializer is None:
+            return lambda interp: interp.env.define(name, None)
+        return lambda interp: interp.env.define(name, initializer(interp))
+    if initializer is None:
+        def execute(interp):
+            interp.env.slots[slot] = None
+        return execute
+
+    def execute(interp):
+        interp.env.slots[slot] = initializer(interp)
+    return execute
+
+
+def _compile_assignment(node: AssignmentNode):
+    if node.target.depth != 0:
+        # Outer-frame and global targets keep the visitor's handling
+        return lambda interp: interp._dispatch[AssignmentNode](node)
+    value, slot = _compile_expr(node.value), node.target.slot
+
+    def execute(interp):
+        interp.env.slots[slot] = value(interp)
+    return execute
+
+
+def _compile_return(node: ReturnNode):
+    if type(node.value) is CallNode:
+        call = node.value
+
+        def execute(interp):
+            interp._return_call(call)
+            interp._returning = True
+        return execute
+
+    value = _compile_expr(node.value) if node.value else None
+
+    def execute(interp):
+        interp._return_value = value(interp) if value is not None else None
+        interp._returning = True
+    return execute
+
+
+_STMT_COMPILERS = {
+    VariableDeclNode: _compile_variable_decl,
+    AssignmentNode: _compile_assignment,
+    ReturnNode: _compile_return,
+}
+
+
+# --- Counted for-loops ---
+#
+# `for (let i = start; i < end; i = i + k)` with a constant positive k, an
+# end bound the body cannot change and a body that never writes i runs on
+# a C-level range() instead of evaluating condition and increment per
+# iteration. Loops that do not match, or whose bounds are not ints at
+# runtime, take the generic path.
+
+def _walk(node: ASTNode):
+    """Yield `node` and every AST node below it."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        for cls in type(current).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                value = getattr(current, name, None)
+                if isinstance(value, ASTNode):
+                    stack.append(value)
+                elif isinstance(value, list):
+                    stack.extend(v for v in value if isinstance(v, ASTNode))
+
+
+def _is_loop_variable(expr, slot) -> bool:
+    return type(expr) is VariableNode and expr.depth == 0 and expr.slot == slot
+
+
+def _counted_loop_plan(node: ForNode):
+    """
+    Return (slot, end_node, step, inclusive) when `node` is a counted loop,
+    otherwise False.
+    """
+    init, cond, incr = node.initializer, node.condition, node.increment
+    if type(init) is not VariableDeclNode or init.slot is None:
+        return False
+    slot = init.slot
+
+    if type(cond) is not BinaryOpNode or cond.op not in (Op.LT, Op.LE):
+        return False
+    if not _is_loop_variable(cond.left, slot):
+        return False
+    end = cond.right
+
+    if type(incr) is not AssignmentNode or not _is_loop_variable(incr.target, slot):
+        return False
+    step_expr = incr.value
+    if (type(step_expr) is not BinaryOpNode or step_expr.op is not Op.ADD
+            or not _is_loop_variable(step_expr.left, slot)
+            or type(step_expr.right) is not LiteralNode):
+        return False
+    step = step_expr.right.value
+    if type(step) is not int or step <= 0:
+        return False
+
+    # The bound is evaluated once, so it must be a constant or a variable
+    # nothing in the body can reassign (no writes to it, no calls)
+    if type(end) is VariableNode:
+        end_name = end.name
+    elif type(end) is LiteralNode:
+        end_name = None
+    else:
+        return False
+
+    for sub in _walk(node.body):
+        kind = type(sub)
+        if kind is AssignmentNode or kind is VariableDeclNode:
+            name = sub.target.name if kind is AssignmentNode else sub.name
+            if name == init.name or name == end_name:
+                return False
+        elif kind is CallNode and end_name is not None:
+            return False
+
+    return (slot, end, step, cond.op is Op.LE)
+
 
 class Interpreter(ASTVisitor):
     def __init__(self):
         self.global_env = Environment()
         self.env = self.global_env  # Current environment/scope
         self.type_checker = TypeChecker()
+        self.resolver = Resolver()
+        # type(node) -> bound visit method; used instead of node.accept(self)
+        self._dispatch = self.build_dispatch()
+        # Literals evaluate to their stored value; attrgetter avoids a Python frame
+        self._dispatch[LiteralNode] = operator.attrgetter('value')
+        # `return` sets these instead of raising; blocks and loops stop as soon
+        # as _returning is set and Function.call collects the value
+        self._returning = False
+        self._return_value = None
+        # (Function, args) of a call in return position, run by Function.call
+        # in place of the returning function's frame (see _return_call)
+        self._tail_call = None
 
     # --- Helpers for environment and scopes ---
 
-    def push_env(self):
-        self.env = Environment(parent=self.env)
+    def push_env(self, size: int = 0):
+        self.env = Environment(parent=self.env, size=size)
 
     def pop_env(self):
         self.env = self.env.parent
 
+    def _define(self, slot, name, value):
+        # Resolved locals are written by slot; globals go to the dict
+        if slot is None:
+            self.env.define(name, value)
+        else:
+            self.env.slots[slot] = value
+
     # --- Entry point ---
 
     def interpret(self, node: ASTNode):
+        # Bind local variables to (depth, slot) before running
+        self.resolver.resolve(node)
         try:
-            return node.accept(self)
+            result = self._dispatch[type(node)](node)
+            if self._returning:
+                self._returning = False
+                self._return_value = None
+                tail_call = self._tail_call
+                if tail_call is not None:
+                    # `return f()` outside a function still calls f
+                    self._tail_call = None
+                    callee, arguments = tail_call
+                    callee.call(self, arguments)
+                print("Unexpected return statement outside function.")
+                return None
         except RuntimeError as e:
             print(f"Runtime error at {e.line}:{e.column} - {e}")
             return None
-        except ReturnException as ret:
-            print("Unexpected return statement outside function.")
-            return None
+        return result
 
     # --- Expression Visitors ---
 
@@ -37,56 +348,70 @@ class Interpreter(ASTVisitor):
         return node.value
 
     def visit_variable(self, node: VariableNode):
-        value = self.env.get(node.name)
+        depth = node.depth
+        if depth == 0:
+            # Most reads hit the innermost frame
+            value = self.env.slots[node.slot]
+        elif depth is None:
+            value = self.global_env.values.get(node.name)
+        else:
+            env = self.env
+            while depth:
+                env = env.parent
+                depth -= 1
+            value = env.slots[node.slot]
         if value is None:
             raise RuntimeError(f"Undefined variable '{node.name}'", node.line, node.column)
         return value
 
     def visit_binary_op(self, node: BinaryOpNode):
-        left = node.left.accept(self)
-        right = node.right.accept(self)
-        op = node.operator
-
-        # Example basic ops - extend as needed
-        if op == '+':
-            self.type_checker.check_numeric(left, right, node)
-            return left + right
-        elif op == '-':
-            self.type_checker.check_numeric(left, right, node)
-            return left - right
-        elif op == '*':
-            self.type_checker.check_numeric(left, right, node)
-            return left * right
-        elif op == '/':
-            self.type_checker.check_numeric(left, right, node)
-            if right == 0:
-                raise RuntimeError("Division by zero", node.line, node.column)
-            return left / right
-        elif op == '==':
-            return left == right
-        elif op == '!=':
-            return left != right
-        elif op == '<':
-            self.type_checker.check_numeric(left, right, node)
-            return left < right
-        elif op == '<=':
-            self.type_checker.check_numeric(left, right, node)
-            return left <= right
-        elif op == '>':
-            self.type_checker.check_numeric(left, right, node)
-            return left > right
-        elif op == '>=':
-            self.type_checker.check_numeric(left, right, node)
-            return left >= right
-        elif op == '&&':
-            return bool(left) and bool(right)
-        elif op == '||':
-            return bool(left) or bool(right)
-        else:
-            raise RuntimeError(f"Unknown binary operator '{op}'", node.line, node.column)
+        evaluate = node.compiled
+        if evaluate is None:
+            evaluate = node.compiled = _compile_expr(node)
+        return evaluate(self)
+
+    def _eval_binary_op(self, node: BinaryOpNode):
+        # Uncompiled path; compiled closures defer to it for unknown ops
+        dispatch = self._dispatch
+        left = dispatch[type(node.left)](node.left)
+        op = node.op
+
+        # && and || short-circuit, so the right operand is evaluated lazily
+        if op is Op.AND:
+            if not left:
+                return False
+            return True if dispatch[type(node.right)](node.right) else False
+        elif op is Op.OR:
+            if left:
+                return True
+            return True if dispatch[type(node.right)](node.right) else False
+
+        right = dispatch[type(node.right)](node.right)
+
+        fn = _NUMERIC_BINOPS.get(op)
+        if fn is not None:
+            # Inline numeric check; same rule as TypeChecker.check_numeric
+            if not (isinstance(left, _NUMERIC_TYPES) and isinstance(right, _NUMERIC_TYPES)):
+                raise RuntimeError("Operands must be numeric", node.line, node.column)
+            try:
+                return fn(left, right)
+            except ZeroDivisionError:
+                raise RuntimeError("Division by zero", node.line, node.column) from None
+
+        fn = _GENERIC_BINOPS.get(op)
+        if fn is not None:
+            return fn(left, right)
+
+        raise RuntimeError(f"Unknown binary operator '{node.operator}'", node.line, node.column)
 
     def visit_unary_op(self, node: UnaryOpNode):
-        operand = node.operand.accept(self)
+        evaluate = node.compiled
+        if evaluate is None:
+            evaluate = node.compiled = _compile_expr(node)
+        return evaluate(self)
+
+    def _eval_unary_op(self, node: UnaryOpNode):
+        operand = self._dispatch[type(node.operand)](node.operand)
         op = node.operator
 
         if op == '-':
@@ -98,70 +423,152 @@ class Interpreter(ASTVisitor):
             raise RuntimeError(f"Unknown unary operator '{op}'", node.line, node.column)
 
     def visit_call(self, node: CallNode):
-        callee = node.callee.accept(self)
-
-        if not callable(callee):
+        return self._invoke(node, self._dispatch[type(node.callee)](node.callee))
+
+    def _invoke(self, node: CallNode, callee):
+        dispatch = self._dispatch
+        # User-defined functions take the fast path; anything else is
+        # checked with callable() and invoked as a native Python callable
+        if type(callee) is Function:
+            call = callee.call
+        elif callable(callee):
+            call = self._call_native(callee)
+        else:
             raise RuntimeError(f"Attempted to call non-function '{callee}'", node.line, node.column)
 
-        args = [arg.accept(self) for arg in node.arguments]
+        args = [dispatch[type(arg)](arg) for arg in node.arguments]
         try:
-            # Assume user-defined functions are closures represented as Function objects (defined later)
-            return callee.call(self, args)
+            return call(self, args)
         except RuntimeError as e:
-            # Propagate runtime error with location info from call site
-            raise RuntimeError(str(e), node.line, node.column)
+            # Errors raised without a location (e.g. by native callables) get
+            # the call site's; the same exception is re-raised, not rebuilt
+            if e.line is None:
+                e.line = node.line
+                e.column = node.column
+            raise
+
+    @staticmethod
+    def _call_native(fn):
+        # Adapt a Python callable to the Function.call(interpreter, args) signature
+        return lambda interpreter, args: fn(*args)
 
     # --- Statement Visitors ---
 
     def visit_variable_decl(self, node: VariableDeclNode):
-        value = node.initializer.accept(self) if node.initializer else None
-        self.env.define(node.name, value)
+        value = self._dispatch[type(node.initializer)](node.initializer) if node.initializer else None
+        self._define(node.slot, node.name, value)
 
     def visit_assignment(self, node: AssignmentNode):
-        value = node.value.accept(self)
-        if not self.env.assign(node.target.name, value):
-            raise RuntimeError(f"Undefined variable '{node.target.name}'", node.line, node.column)
+        value = self._dispatch[type(node.value)](node.value)
+        target = node.target
+        depth = target.depth
+        if depth == 0:
+            self.env.slots[target.slot] = value
+            return
+        if depth is None:
+            if not self.global_env.assign(target.name, value):
+                raise RuntimeError(f"Undefined variable '{target.name}'", node.line, node.column)
+            return
+        env = self.env
+        while depth:
+            env = env.parent
+            depth -= 1
+        env.slots[target.slot] = value
 
     def visit_block(self, node: BlockNode):
-        self.push_env()
+        dispatch = self._dispatch
+        # push_env/pop_env inlined: this runs once per block execution
+        outer = self.env
+        self.env = Environment(outer, node.scope_size)
         try:
             for stmt in node.statements:
-                stmt.accept(self)
+                dispatch[type(stmt)](stmt)
+                if self._returning:
+                    break
         finally:
-            self.pop_env()
+            self.env = outer
 
     def visit_if(self, node: IfNode):
-        cond = node.condition.accept(self)
+        cond = self._dispatch[type(node.condition)](node.condition)
         if cond:
-            node.then_branch.accept(self)
+            self._dispatch[type(node.then_branch)](node.then_branch)
         elif node.else_branch:
-            node.else_branch.accept(self)
+            self._dispatch[type(node.else_branch)](node.else_branch)
 
     def visit_while(self, node: WhileNode):
-        while node.condition.accept(self):
-            node.body.accept(self)
+        # Resolve the visit methods once; node types do not change mid-loop
+        condition, body = node.condition, node.body
+        cond_visit = self._dispatch[type(condition)]
+        body_visit = self._dispatch[type(body)]
+        while cond_visit(condition):
+            body_visit(body)
+            if self._returning:
+                return
 
     def visit_for(self, node: ForNode):
-        self.push_env()
+        dispatch = self._dispatch
+        condition, body, increment = node.condition, node.body, node.increment
+        cond_visit = dispatch[type(condition)]
+        body_visit = dispatch[type(body)]
+        incr_visit = dispatch[type(increment)]
+        plan = node.counted
+        if plan is None:
+            plan = node.counted = _counted_loop_plan(node)
+        outer = self.env
+        env = self.env = Environment(outer, node.scope_size)
         try:
-            node.initializer.accept(self)
-            while node.condition.accept(self):
-                node.body.accept(self)
-                node.increment.accept(self)
+            dispatch[type(node.initializer)](node.initializer)
+            if plan:
+                slot, end_node, step, inclusive = plan
+                slots = env.slots
+                start = slots[slot]
+                end = dispatch[type(end_node)](end_node)
+                if type(start) is int and type(end) is int:
+                    counter = range(start, end + 1 if inclusive else end, step)
+                    for i in counter:
+                        slots[slot] = i
+                        body_visit(body)
+                        if self._returning:
+                            return
+                    # Leave the value the generic loop would stop at
+                    slots[slot] = counter[-1] + step if counter else start
+                    return
+            while cond_visit(condition):
+                body_visit(body)
+                if self._returning:
+                    return
+                incr_visit(increment)
         finally:
-            self.pop_env()
+            self.env = outer
 
     def visit_return(self, node: ReturnNode):
-        value = node.value.accept(self) if node.value else None
-        raise ReturnException(value)
+        value = node.value
+        if type(value) is CallNode:
+            self._return_call(value)
+        else:
+            self._return_value = self._dispatch[type(value)](value) if value else None
+        self._returning = True
+
+    def _return_call(self, node: CallNode):
+        # A user-defined function called in return position is not entered
+        # here: its arguments are evaluated and Function.call runs it in a
+        # loop in place of the returning function, so tail recursion takes
+        # neither Python stack nor a nested call() per level
+        callee = self._dispatch[type(node.callee)](node.callee)
+        if type(callee) is Function:
+            dispatch = self._dispatch
+            self._tail_call = (callee, [dispatch[type(arg)](arg) for arg in node.arguments])
+            self._return_value = None
+        else:
+            self._return_value = self._invoke(node, callee)
 
     def visit_function_def(self, node: FunctionDefNode):
         func = Function(node, self.env)
-        self.env.define(node.name, func)
+        self._define(node.slot, node.name, func)
 
     def visit_struct_def(self, node: StructDefNode):
         # For now: store struct metadata in environment (could be expanded)
-        self.env.define(node.name, node)
+        self._define(node.slot, node.name, node)
 
     def visit_import(self, node: ImportNode):
         # Stub: Could integrate module system
@@ -170,50 +577,87 @@ class Interpreter(ASTVisitor):
 # --- Function object to represent user-defined functions with closures ---
 
 class Function:
+    __slots__ = ('declaration', 'closure', 'params', 'arity', 'body', 'statements',
+                 'code', 'locals_padding', 'line', 'col')
+
     def __init__(self, declaration: FunctionDefNode, closure: Environment):
         self.declaration = declaration
         self.closure = closure  # The environment at function declaration time (for closures)
+        # Resolved once here so call() only reads plain attributes
+        self.params = tuple(declaration.params)
+        self.arity = len(self.params)
+        self.body = declaration.body
+        # The body block runs directly in the call frame (see Resolver)
+        body = declaration.body
+        self.statements = tuple(body.statements) if isinstance(body, BlockNode) else (body,)
+        self.code = declaration.compiled  # None until the first call compiles it
+        self.locals_padding = [None] * (declaration.local_count - self.arity)
+        self.line = declaration.line
+        self.col = declaration.column
 
     def call(self, interpreter: Interpreter, arguments: list):
-        # Create new environment for function call, enclosing closure
-        env = Environment(parent=self.closure)
-        # Bind parameters
-        if len(arguments) != len(self.declaration.params):
-            raise RuntimeError(f"Expected {len(self.declaration.params)} arguments but got {len(arguments)}",
-                               self.declaration.line, self.declaration.column)
-
-        for name, value in zip(self.declaration.params, arguments):
-            env.define(name, value)
-
-        # Execute function body in new environment
+        func = self
+        caller_env = interpreter.env
         try:
-            interpreter.push_env()
-            interpreter.env = env
-            self.declaration.body.accept(interpreter)
-        except ReturnException as ret:
-            return ret.value
+            # Each iteration runs one function; a tail call (see
+            # Interpreter._return_call) continues the loop with the callee
+            while True:
+                if len(arguments) != func.arity:
+                    raise RuntimeError(f"Expected {func.arity} arguments but got {len(arguments)}",
+                                       func.line, func.col)
+
+                # Create new environment for function call, enclosing closure;
+                # parameters occupy the first slots, then the body's locals
+                env = Environment(parent=func.closure)
+                env.slots = arguments + func.locals_padding
+
+                code = func.code
+                if code is None:
+                    code = func.declaration.compiled
+                    if code is None:
+                        code = func.declaration.compiled = tuple(_compile_stmt(stmt) for stmt in func.statements)
+                    func.code = code
+
+                # Execute function body in new environment; the caller's is
+                # restored once the last function in the chain returns
+                interpreter.env = env
+                for step in code:
+                    step(interpreter)
+                    if interpreter._returning:
+                        break
+                else:
+                    # If no explicit return, return None
+                    return None
+
+                interpreter._returning = False
+                tail_call = interpreter._tail_call
+                if tail_call is None:
+                    value = interpreter._return_value
+                    interpreter._return_value = None
+                    return value
+                interpreter._tail_call = None
+                func, arguments = tail_call
         finally:
-            interpreter.pop_env()
-
-        # If no explicit return, return None
-        return None
+            interpreter.env = caller_env
 
 
 # --- runtime.py (stubs for demonstration) ---
 
 class RuntimeError(Exception):
+    __slots__ = ('line', 'column')
+
     def __init__(self, message, line=None, column=None):
         super().__init__(message)
         self.line = line
         self.column = column
 
-class ReturnException(Exception):
-    def __init__(self, value):
-        self.value = value
-
 class Environment:
-    def __init__(self, parent=None):
-        self.values = {}
+    # Allocated on every block, loop and call; slots keep instances small
+    __slots__ = ('values', 'slots', 'parent')
+
+    def __init__(self, parent=None, size=0):
+        self.values = {}  # globals and other unresolved names
+        self.slots = [None] * size  # resolved locals, indexed by slot
         self.parent = parent
 
     def define(self, name, value):
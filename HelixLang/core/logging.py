@@ -12,16 +12,32 @@ Features:
 - Optional file logging
 - Optional JSON structured logs
 - Color-coded output for terminal
+- Asynchronous output: records are queued and written in batches by a
+  background thread (see flush_logs())
 """
 
 import os
 import sys
 import json
 import time
+import atexit
 import threading
+from collections import deque, namedtuple
 from enum import IntEnum
 from typing import Optional, Any
 
+try:
+    import orjson  # optional, faster JSON serialization
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _dumps = json.dumps
+
 
 # -----------------------------
 # Log Levels
@@ -46,6 +62,182 @@ COLOR_MAP = {
     "RESET": "\033[0m"
 }
 
+# Level -> "NAME: " tag used by the text formatter
+_LEVEL_TAGS = {level: f"{level.name}: " for level in LogLevel}
+
+# Level -> (prefix, suffix) wrapped around colored console records
+_COLOR_WRAP = {level: (COLOR_MAP[level], COLOR_MAP["RESET"]) for level in LogLevel}
+
+
+def _console_is_tty() -> bool:
+    """
+    True when both stdout and stderr are terminals; escape codes written
+    to a redirected stream are only noise.
+    """
+    try:
+        return sys.stdout.isatty() and sys.stderr.isatty()
+    except (AttributeError, ValueError):  # replaced or closed stream
+        return False
+
+
+# -----------------------------
+# Timestamps
+# -----------------------------
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# [epoch second, formatted string]; racing threads at worst format the
+# same second twice
+_ts_cache = [None, ""]
+
+
+def _now_str(t: float) -> str:
+    """
+    Format epoch time t with TIMESTAMP_FORMAT, reformatting only when the
+    second changes.
+    """
+    second = int(t)
+    cache = _ts_cache
+    if cache[0] != second:
+        cache[1] = time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+        cache[0] = second
+    return cache[1]
+
+
+# -----------------------------
+# Background Writer
+# -----------------------------
+
+# A formatted record: console stream and text, plus the log file and its
+# line (None when the logger has no file)
+_LogRecord = namedtuple("_LogRecord", "stream text log_file file_text")
+
+LOG_QUEUE_SIZE = 8192   # callers wait for a drain once this many are pending
+LOG_MAX_BATCH = 256     # records written per drain
+
+# Pending records (and flush markers). deque.append is atomic, so logging
+# threads never take a lock per record; they only set _wakeup when the
+# writer is idle, and contention is left to the writer's drains.
+_log_buffer = deque()
+_wakeup = threading.Event()
+_writer_thread = None
+_writer_lock = threading.Lock()
+
+
+def _append(log_file, text):
+    """
+    Append text to the file with os.write() on its descriptor, one write(2)
+    for the whole batch, bypassing the text and buffer layers. The file is
+    opened in append mode, so concurrent appenders never split a batch.
+    """
+    log_file.flush()  # anything written through the file object goes first
+    data = memoryview(text.encode(log_file.encoding or "utf-8", log_file.errors or "strict"))
+    fd = log_file.fileno()
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _write_console(stream, texts):
+    try:
+        stream.write("".join(texts))
+        stream.flush()
+    except Exception:
+        pass  # console gone (e.g. closed at shutdown)
+
+
+def _write_batch(batch):
+    """
+    Write a batch with one write per run of consecutive records on the same
+    console stream, so stdout and stderr records interleave in logging
+    order, and one direct append per log file.
+    """
+    files = {}
+    stream = None
+    texts = []
+    for record in batch:
+        if record.stream is not stream:
+            if texts:
+                _write_console(stream, texts)
+            stream = record.stream
+            texts = []
+        texts.append(record.text)
+        if record.log_file is not None:
+            files.setdefault(record.log_file, []).append(record.file_text)
+    if texts:
+        _write_console(stream, texts)
+
+    for log_file, lines in files.items():
+        try:
+            _append(log_file, "".join(lines))
+        except Exception as e:
+            print(f"Error writing to log file: {e}")
+
+
+def _drain_forever():
+    buffer = _log_buffer
+    while True:
+        _wakeup.wait()
+        # Clear before draining: a record appended after this point either
+        # sees the flag unset and sets it, or is picked up by the loop below
+        _wakeup.clear()
+        while buffer:
+            batch = []
+            markers = []
+            try:
+                while len(batch) < LOG_MAX_BATCH:
+                    item = buffer.popleft()
+                    if type(item) is _LogRecord:
+                        batch.append(item)
+                    else:
+                        markers.append(item)
+            except IndexError:
+                pass
+            try:
+                if batch:
+                    _write_batch(batch)
+            finally:
+                for marker in markers:
+                    marker.set()
+
+
+def _ensure_writer():
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_drain_forever, name="helixlang-log-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def _reset_after_fork():
+    # The child has no writer thread; the inherited state would make the
+    # first flush_logs() wait forever. Records queued by the parent are
+    # left for the parent to write.
+    global _log_buffer, _wakeup, _writer_thread, _writer_lock
+    _log_buffer = deque()
+    _wakeup = threading.Event()
+    _writer_thread = None
+    _writer_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def flush_logs():
+    """
+    Block until every log record queued before the call has been written.
+    """
+    if _writer_thread is not None:
+        done = threading.Event()
+        _log_buffer.append(done)
+        _wakeup.set()
+        done.wait()
+
+
+atexit.register(flush_logs)
+
 
 # -----------------------------
 # Logger Class
@@ -61,11 +253,11 @@ class Logger:
         enable_colors: bool = True,
     ):
         self.name = name
+        self._prefix = f" [{name}] "  # fixed part of every text record
         self.level = level
         self.log_file_path = log_to_file
+        self._enable_colors = enable_colors
         self.use_json = use_json
-        self.enable_colors = enable_colors
-        self._lock = threading.Lock()
 
         if self.log_file_path:
             try:
@@ -76,42 +268,68 @@ class Logger:
         else:
             self.log_file = None
 
+    @property
+    def use_json(self) -> bool:
+        return self._use_json
+
+    @use_json.setter
+    def use_json(self, value: bool):
+        # log() calls the pre-bound formatter instead of testing the flag
+        self._use_json = value
+        self._formatter = self._format_json if value else self._format_message
+        self._update_use_color()
+
+    @property
+    def enable_colors(self) -> bool:
+        return self._enable_colors
+
+    @enable_colors.setter
+    def enable_colors(self, value: bool):
+        self._enable_colors = value
+        self._update_use_color()
+
+    def _update_use_color(self):
+        # Decided when the options change, not per record
+        self._use_color = self._enable_colors and not self._use_json and _console_is_tty()
+
     def _format_message(self, level: LogLevel, msg: str) -> str:
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-        return f"{timestamp} [{self.name}] {level.name}: {msg}"
+        return f"{_now_str(time.time())}{self._prefix}{_LEVEL_TAGS[level]}{msg}"
 
     def _format_json(self, level: LogLevel, msg: str) -> str:
+        now = time.time()
         log_obj = {
-            "timestamp": time.time(),
-            "datetime": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+            "timestamp": now,
+            "datetime": _now_str(now),
             "module": self.name,
             "level": level.name,
             "message": msg
         }
-        return json.dumps(log_obj)
+        return _dumps(log_obj)
 
     def _write(self, message: str, level: LogLevel):
-        with self._lock:
-            if self.enable_colors and not self.use_json:
-                color = COLOR_MAP.get(level, "")
-                reset = COLOR_MAP["RESET"]
-                print(f"{color}{message}{reset}", file=sys.stderr if level >= LogLevel.ERROR else sys.stdout)
-            else:
-                print(message, file=sys.stderr if level >= LogLevel.ERROR else sys.stdout)
-
-            if self.log_file:
-                try:
-                    self.log_file.write(message + "\n")
-                    self.log_file.flush()
-                except Exception as e:
-                    print(f"Error writing to log file: {e}")
+        # Queue the record for the background writer; the caller never
+        # touches the console or file itself
+        stream = sys.stderr if level >= LogLevel.ERROR else sys.stdout
+        if self._use_color:
+            prefix, suffix = _COLOR_WRAP.get(level, ("", ""))
+            text = f"{prefix}{message}{suffix}\n"
+        else:
+            text = message + "\n"
+        log_file = self.log_file
+        if _writer_thread is None:
+            _ensure_writer()
+        _log_buffer.append(_LogRecord(stream, text, log_file, message + "\n" if log_file else None))
+        if not _wakeup.is_set():
+            _wakeup.set()
+        if len(_log_buffer) >= LOG_QUEUE_SIZE:
+            flush_logs()  # the writer has fallen behind; let it catch up
 
     def log(self, level: LogLevel, msg: str, *args: Any):
         if level < self.level:
             return
-        formatted_msg = msg.format(*args)
-        output = self._format_json(level, formatted_msg) if self.use_json else self._format_message(level, formatted_msg)
-        self._write(output, level)
+        # Plain messages skip str.format's field parsing
+        formatted_msg = msg.format(*args) if args else msg
+        self._write(self._formatter(level, formatted_msg), level)
 
     # Convenience methods
     def debug(self, msg: str, *args: Any):
@@ -131,6 +349,7 @@ class Logger:
 
     def close(self):
         if self.log_file:
+            flush_logs()  # write out records still queued for this file
             try:
                 self.log_file.close()
             except Exception:
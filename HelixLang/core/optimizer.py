@@ -1,10 +1,61 @@
 # optimizer.py
 
+import operator
+
 from helixlang.ast_nodes import (
     ASTNode, BinaryOpNode, UnaryOpNode, LiteralNode, VariableNode, 
-    IfNode, WhileNode, ForNode, BlockNode, FunctionDefNode, AssignmentNode
+    IfNode, WhileNode, ForNode, BlockNode, FunctionDefNode, AssignmentNode,
+    KIND_BINARY_OP, KIND_UNARY_OP, KIND_LITERAL, KIND_IF, KIND_WHILE, KIND_FOR,
+    KIND_RETURN, KIND_BLOCK, KIND_FUNCTION_DEF, KIND_ASSIGNMENT
 )
 
+
+def _safe_div(left_val, right_val):
+    # Avoid division by zero folding here - runtime error should catch it
+    return left_val / right_val if right_val != 0 else None
+
+
+# Operator symbol -> evaluation function for constant folding
+_BIN_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': _safe_div,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '&&': lambda left_val, right_val: left_val and right_val,
+    '||': lambda left_val, right_val: left_val or right_val,
+}
+
+_UN_OPS = {
+    '-': operator.neg,
+    '!': operator.not_,
+}
+
+# Node class -> fields caching interpreter state built from the node's
+# subtree (compiled closures, counted-loop plan)
+_CACHED_FIELDS = {
+    BinaryOpNode: ('compiled',),
+    UnaryOpNode: ('compiled',),
+    FunctionDefNode: ('compiled',),
+    ForNode: ('counted',),
+}
+
+
+def _invalidate(node: ASTNode) -> None:
+    """
+    Drop everything cached from a node's old subtree after a rewrite below
+    it: its string form and any interpreter state.
+    """
+    node.invalidate_str()
+    for name in _CACHED_FIELDS.get(type(node), ()):
+        setattr(node, name, None)
+
+
 class Optimizer:
     """
     Orchestrates optimization passes on the AST.
@@ -26,180 +77,193 @@ class Optimizer:
             ast = opt_pass(ast)
         return ast
 
+    # Node class -> child attributes folded before the node itself. Classes
+    # not listed (literals, variables, calls, ...) are returned unchanged;
+    # BlockNode's children are its statements list.
+    _FOLD_FIELDS = {
+        BinaryOpNode: ('left', 'right'),
+        UnaryOpNode: ('operand',),
+        IfNode: ('condition', 'then_branch', 'else_branch'),
+        WhileNode: ('condition', 'body'),
+        ForNode: ('initializer', 'condition', 'increment', 'body'),
+        BlockNode: (),
+        FunctionDefNode: ('body',),
+        AssignmentNode: ('value',),
+    }
+
     def constant_folding(self, node: ASTNode) -> ASTNode:
         """
-        Recursively fold constant expressions.
+        Fold constant expressions bottom-up.
         e.g. Replace (2 + 3) with 5, or (true && false) with false.
+
+        Walks the tree post-order with an explicit stack, so deep ASTs do
+        not hit the recursion limit.
         """
-        if isinstance(node, BinaryOpNode):
-            left = self.constant_folding(node.left)
-            right = self.constant_folding(node.right)
-
-            if isinstance(left, LiteralNode) and isinstance(right, LiteralNode):
-                folded_value = self._evaluate_binary_op(node.operator, left.value, right.value)
-                if folded_value is not None:
-                    return LiteralNode(folded_value, node.line, node.column)
-
-            return BinaryOpNode(node.operator, left, right, node.line, node.column)
-
-        elif isinstance(node, UnaryOpNode):
-            operand = self.constant_folding(node.operand)
-            if isinstance(operand, LiteralNode):
-                folded_value = self._evaluate_unary_op(node.operator, operand.value)
-                if folded_value is not None:
-                    return LiteralNode(folded_value, node.line, node.column)
-            return UnaryOpNode(node.operator, operand, node.line, node.column)
-
-        elif isinstance(node, IfNode):
-            node.condition = self.constant_folding(node.condition)
-            node.then_branch = self.constant_folding(node.then_branch)
-            node.else_branch = self.constant_folding(node.else_branch) if node.else_branch else None
-            return node
-
-        elif isinstance(node, WhileNode):
-            node.condition = self.constant_folding(node.condition)
-            node.body = self.constant_folding(node.body)
-            return node
-
-        elif isinstance(node, ForNode):
-            node.init = self.constant_folding(node.init) if node.init else None
-            node.condition = self.constant_folding(node.condition) if node.condition else None
-            node.increment = self.constant_folding(node.increment) if node.increment else None
-            node.body = self.constant_folding(node.body)
-            return node
-
-        elif isinstance(node, BlockNode):
-            node.statements = [self.constant_folding(stmt) for stmt in node.statements]
-            return node
-
-        elif isinstance(node, FunctionDefNode):
-            node.body = self.constant_folding(node.body)
-            return node
-
-        elif isinstance(node, AssignmentNode):
-            node.value = self.constant_folding(node.value)
-            return node
-
-        # Default: leaf nodes or unsupported nodes returned as is
+        fields = self._FOLD_FIELDS
+        fold = self._FOLD_DISPATCH
+        results = []  # folded subtrees, in child order
+        dirty = []    # parallel to results: was anything in that subtree rewritten
+        stack = [(node, False)]
+        while stack:
+            current, children_done = stack.pop()
+            cls = type(current)
+            names = fields.get(cls)
+            if names is None:
+                results.append(current)
+                dirty.append(False)
+                continue
+
+            if not children_done:
+                stack.append((current, True))
+                if cls is BlockNode:
+                    children = current.statements
+                else:
+                    children = [getattr(current, name) for name in names]
+                stack.extend((child, False) for child in reversed(children))
+                continue
+
+            count = len(current.statements) if cls is BlockNode else len(names)
+            start = len(results) - count
+            folded = results[start:]
+            del results[start:]
+            # A rewrite anywhere below invalidates every ancestor's cached
+            # forms; untouched subtrees keep their list and cached string
+            changed = any(dirty[start:])
+            del dirty[start:]
+            if cls is BlockNode:
+                statements = current.statements
+                for i, child in enumerate(folded):
+                    if child is not statements[i]:
+                        statements[i] = child
+                        changed = True
+            else:
+                for name, child in zip(names, folded):
+                    if child is not getattr(current, name):
+                        setattr(current, name, child)
+                        changed = True
+            if changed:
+                _invalidate(current)
+
+            handler = fold.get(cls)
+            result = handler(self, current) if handler is not None else current
+            results.append(result)
+            dirty.append(changed or result is not current)
+
+        return results[0]
+
+    def _fold_binary_op(self, node: BinaryOpNode) -> ASTNode:
+        left, right = node.left, node.right
+        if left._kind == KIND_LITERAL and right._kind == KIND_LITERAL:
+            folded_value = self._evaluate_binary_op(node.operator, left.value, right.value)
+            if folded_value is not None:
+                return LiteralNode(folded_value, node.line, node.column)
+        return node
+
+    def _fold_unary_op(self, node: UnaryOpNode) -> ASTNode:
+        operand = node.operand
+        if operand._kind == KIND_LITERAL:
+            folded_value = self._evaluate_unary_op(node.operator, operand.value)
+            if folded_value is not None:
+                return LiteralNode(folded_value, node.line, node.column)
         return node
 
+    # Node class -> fold applied once its children are folded
+    _FOLD_DISPATCH = {
+        BinaryOpNode: _fold_binary_op,
+        UnaryOpNode: _fold_unary_op,
+    }
+
     def dead_code_elimination(self, node: ASTNode) -> ASTNode:
         """
         Remove unreachable or redundant code.
         Example: code after a return statement, branches of 'if' with constant false condition.
         """
-        if isinstance(node, BlockNode):
+        return self._eliminate(node)[0]
+
+    # Node kind -> child attributes dead code elimination descends into.
+    # Blocks are handled separately; other kinds are returned unchanged.
+    _ELIMINATE_FIELDS = {
+        KIND_IF: ('condition', 'then_branch', 'else_branch'),
+        KIND_WHILE: ('condition', 'body'),
+        KIND_FOR: ('initializer', 'condition', 'increment', 'body'),
+        KIND_FUNCTION_DEF: ('body',),
+        KIND_ASSIGNMENT: ('value',),
+        KIND_BINARY_OP: ('left', 'right'),
+        KIND_UNARY_OP: ('operand',),
+    }
+
+    def _eliminate(self, node: ASTNode):
+        """
+        Return (node or its replacement, whether anything in the subtree was
+        rewritten). Nodes with a rewritten descendant are invalidated on the
+        way back up.
+        """
+        kind = node._kind
+        if kind == KIND_BLOCK:
+            statements = node.statements
             new_statements = []
-            has_returned = False
-            for stmt in node.statements:
-                if has_returned:
-                    # Skip unreachable code after return
-                    continue
-                optimized_stmt = self.dead_code_elimination(stmt)
+            changed = False
+            for stmt in statements:
+                optimized_stmt, stmt_changed = self._eliminate(stmt)
                 new_statements.append(optimized_stmt)
-                if isinstance(optimized_stmt, (ReturnNode,)):
-                    has_returned = True
-            node.statements = new_statements
-            return node
-
-        elif isinstance(node, IfNode):
-            node.condition = self.dead_code_elimination(node.condition)
-            node.then_branch = self.dead_code_elimination(node.then_branch)
-            if node.else_branch:
-                node.else_branch = self.dead_code_elimination(node.else_branch)
-
-            # If condition is constant true or false, replace with branch only
-            if isinstance(node.condition, LiteralNode):
-                if node.condition.value is True:
-                    return node.then_branch
-                elif node.condition.value is False:
-                    return node.else_branch or BlockNode([])  # Empty block if no else
-
-            return node
-
-        elif isinstance(node, WhileNode):
-            node.condition = self.dead_code_elimination(node.condition)
-            node.body = self.dead_code_elimination(node.body)
-
-            # If condition is constant false, remove the loop entirely
-            if isinstance(node.condition, LiteralNode) and node.condition.value is False:
-                return BlockNode([])  # Empty block
-
-            return node
-
-        elif isinstance(node, ForNode):
-            node.init = self.dead_code_elimination(node.init) if node.init else None
-            node.condition = self.dead_code_elimination(node.condition) if node.condition else None
-            node.increment = self.dead_code_elimination(node.increment) if node.increment else None
-            node.body = self.dead_code_elimination(node.body)
-
-            # If condition is constant false, remove loop
-            if node.condition and isinstance(node.condition, LiteralNode) and node.condition.value is False:
-                return BlockNode([])
-
-            return node
-
-        elif isinstance(node, FunctionDefNode):
-            node.body = self.dead_code_elimination(node.body)
-            return node
-
-        elif isinstance(node, AssignmentNode):
-            node.value = self.dead_code_elimination(node.value)
-            return node
-
-        elif isinstance(node, BinaryOpNode):
-            node.left = self.dead_code_elimination(node.left)
-            node.right = self.dead_code_elimination(node.right)
-            return node
-
-        elif isinstance(node, UnaryOpNode):
-            node.operand = self.dead_code_elimination(node.operand)
-            return node
-
-        # Default fallback
-        return node
-
-    # Helper evaluation functions for constant folding
-
-    def _evaluate_binary_op(self, operator: str, left_val, right_val):
+                changed = changed or stmt_changed or optimized_stmt is not stmt
+                if optimized_stmt._kind == KIND_RETURN:
+                    break  # Skip unreachable code after return
+            if len(new_statements) != len(statements):
+                changed = True
+            if changed:
+                node.statements = new_statements
+                _invalidate(node)
+            return node, changed
+
+        names = self._ELIMINATE_FIELDS.get(kind)
+        if names is None:
+            return node, False
+
+        changed = False
+        for name in names:
+            child = getattr(node, name)
+            if child is None:
+                continue
+            optimized_child, child_changed = self._eliminate(child)
+            if optimized_child is not child:
+                setattr(node, name, optimized_child)
+                child_changed = True
+            changed = changed or child_changed
+        if changed:
+            _invalidate(node)
+
+        condition = node.condition if kind in (KIND_IF, KIND_WHILE, KIND_FOR) else None
+        if condition is not None and condition._kind == KIND_LITERAL:
+            if kind == KIND_IF:
+                # If condition is constant true or false, replace with branch only
+                if condition.value is True:
+                    return node.then_branch, True
+                elif condition.value is False:
+                    # Empty block if no else
+                    return node.else_branch or BlockNode([], node.line, node.column), True
+            elif condition.value is False:
+                # A loop whose condition is constant false is removed entirely
+                return BlockNode([], node.line, node.column), True
+
+        return node, changed
+
+    # Helper evaluation functions for constant folding; None means "do not fold"
+
+    def _evaluate_binary_op(self, op: str, left_val, right_val):
+        fn = _BIN_OPS.get(op)
+        if fn is None:
+            return None
         try:
-            if operator == '+':
-                return left_val + right_val
-            elif operator == '-':
-                return left_val - right_val
-            elif operator == '*':
-                return left_val * right_val
-            elif operator == '/':
-                # Avoid division by zero folding here - runtime error should catch it
-                return left_val / right_val if right_val != 0 else None
-            elif operator == '==':
-                return left_val == right_val
-            elif operator == '!=':
-                return left_val != right_val
-            elif operator == '<':
-                return left_val < right_val
-            elif operator == '<=':
-                return left_val <= right_val
-            elif operator == '>':
-                return left_val > right_val
-            elif operator == '>=':
-                return left_val >= right_val
-            elif operator == '&&':
-                return left_val and right_val
-            elif operator == '||':
-                return left_val or right_val
-            else:
-                return None
+            return fn(left_val, right_val)
         except Exception:
             return None
 
-    def _evaluate_unary_op(self, operator: str, operand_val):
+    def _evaluate_unary_op(self, op: str, operand_val):
+        fn = _UN_OPS.get(op)
+        if fn is None:
+            return None
         try:
-            if operator == '-':
-                return -operand_val
-            elif operator == '!':
-                return not operand_val
-            else:
-                return None
+            return fn(operand_val)
         except Exception:
             return None
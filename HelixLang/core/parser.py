@@ -1,14 +1,39 @@
 # helixlang/core/parser.py
 
-from helixlang.core.tokenizer import Token, TokenType
+from helixlang.core.tokenizer import Token, TokenType, Tokenizer
 from helixlang.core.ast_nodes import *
 from helixlang.core.errors import HelixSyntaxError
 
+
+# Binary operator token -> precedence (higher binds tighter); built once
+# at import instead of on every operator the parser looks at
+_PRECEDENCE = {
+    TokenType.EQEQ: 1,
+    TokenType.PLUS: 2,
+    TokenType.MINUS: 2,
+    TokenType.STAR: 3,
+    TokenType.SLASH: 3,
+    # more operators...
+}
+
+_BINARY_OPERATORS = frozenset(_PRECEDENCE)
+
+# Literal token -> fixed value; NUMBER and STRING carry theirs on the token
+_LITERAL_TOKENS = {
+    TokenType.NUMBER: None,
+    TokenType.STRING: None,
+    TokenType.TRUE: True,
+    TokenType.FALSE: False,
+}
+
+
 class Parser:
     def __init__(self, tokens):
         self.tokens = tokens
         self.position = 0
         self.current_token = self.tokens[self.position] if self.tokens else None
+        # (type, value) -> shared LiteralNode; every `0` or `true` in a parse is one node
+        self._literals = {}
 
     def peek(self, offset=0):
         pos = self.position + offset
@@ -63,67 +88,110 @@ class Parser:
             return ExpressionStatementNode(expr)
 
     def parse_expression(self, precedence=0):
-        """Parse expressions using precedence climbing algorithm"""
-        left = self.parse_primary()
+        """
+        Parse a binary expression by operator precedence, stopping at the
+        first operator that binds looser than `precedence`.
+
+        Iterative shunting-yard: operands and pending operators are kept on
+        explicit stacks, so a long chain like a + b + c + ... is parsed in a
+        loop rather than one recursive call per operator. Parenthesized
+        subexpressions still recurse through parse_primary().
+        """
+        # parse_primary() reads self.position/current_token, so those stay
+        # the source of truth; the loop only caches the lookups it repeats
+        tokens = self.tokens
+        n = len(tokens)
+        get_precedence = _PRECEDENCE.get
+        parse_primary = self.parse_primary
+        reduce_binary = self._reduce_binary
+        operands = [parse_primary()]
+        operators = []  # (operator token, precedence), precedence increasing
 
         while True:
             op = self.current_token
-            if op is None or not self.is_operator(op.type):
+            if op is None:
                 break
 
-            op_precedence = self.get_precedence(op.type)
-            if op_precedence < precedence:
+            # Non-operators have precedence 0
+            op_precedence = get_precedence(op.type, 0)
+            if op_precedence == 0 or op_precedence < precedence:
                 break
 
-            self.advance()
-            right = self.parse_expression(op_precedence + 1)
-            left = BinaryOpNode(left, op.type, right)
-
-        return left
+            # Operators are left-associative: reduce everything pending that
+            # binds at least as tightly before pushing this one
+            while operators and operators[-1][1] >= op_precedence:
+                reduce_binary(operands, operators.pop()[0])
+            operators.append((op, op_precedence))
+
+            # Inlined advance()
+            pos = self.position + 1
+            self.position = pos
+            self.current_token = tokens[pos] if pos < n else None
+            operands.append(parse_primary())
+
+        while operators:
+            reduce_binary(operands, operators.pop()[0])
+        return operands[0]
+
+    def _reduce_binary(self, operands, op):
+        """Replace the top two operands with their BinaryOpNode under `op`."""
+        right = operands.pop()
+        left = operands.pop()
+        operands.append(BinaryOpNode(left, op.value, right, op.line, op.column))
+
+    def literal(self, value, token):
+        """
+        Return the shared LiteralNode for `value`, creating it on first use.
+        Keyed on the value's type as well, so 1, 1.0 and true stay distinct.
+        Shared nodes keep the position of their first occurrence; passes
+        must replace literal nodes rather than mutate them.
+        """
+        key = (type(value), value)
+        node = self._literals.get(key)
+        if node is None:
+            node = self._literals[key] = LiteralNode(value, token.line, token.column)
+        return node
 
     def parse_primary(self):
         """Parse literals, variables, parentheses, function calls"""
         token = self.current_token
-        if token.type == TokenType.NUMBER:
-            self.advance()
-            return NumberNode(token.value)
-        elif token.type == TokenType.IDENT:
+        token_type = token.type
+        if token_type in _LITERAL_TOKENS:
+            # Inlined advance() for the most common primary
+            tokens = self.tokens
+            pos = self.position + 1
+            self.position = pos
+            self.current_token = tokens[pos] if pos < len(tokens) else None
+            value = _LITERAL_TOKENS[token_type]
+            return self.literal(token.value if value is None else value, token)
+        elif token_type == TokenType.IDENT:
             self.advance()
             # Could be variable or function call
             if self.current_token and self.current_token.type == TokenType.LPAREN:
                 return self.parse_function_call(token.value)
             return VariableNode(token.value)
-        elif token.type == TokenType.LPAREN:
+        elif token_type == TokenType.LPAREN:
             self.advance()
             expr = self.parse_expression()
             self.expect(TokenType.RPAREN)
             return expr
         else:
-            self.error(f"Unexpected token {token.type}")
+            self.error(f"Unexpected token {token_type}")
 
     # Additional methods: parse_if_statement, parse_while_statement, parse_function_call, parse_variable_declaration, etc.
 
     def is_operator(self, token_type):
         # Return True if token_type is a binary operator
-        return token_type in {
-            TokenType.PLUS,
-            TokenType.MINUS,
-            TokenType.STAR,
-            TokenType.SLASH,
-            TokenType.EQEQ,
-            # etc...
-        }
+        return token_type in _BINARY_OPERATORS
 
     def get_precedence(self, token_type):
-        precedences = {
-            TokenType.EQEQ: 1,
-            TokenType.PLUS: 2,
-            TokenType.MINUS: 2,
-            TokenType.STAR: 3,
-            TokenType.SLASH: 3,
-            # more operators...
-        }
-        return precedences.get(token_type, 0)
+        return _PRECEDENCE.get(token_type, 0)
 
     # Implement parse_if_statement, parse_while_statement, parse_function_call, parse_variable_declaration similarly
 
+
+def parse_source_stream(stream):
+    """
+    Tokenize and parse HelixLang source read incrementally from a text stream.
+    """
+    return Parser(Tokenizer(stream).tokenize()).parse()
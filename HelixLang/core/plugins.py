@@ -18,9 +18,15 @@ custom syntax, or runtime features.
 import importlib
 import os
 import sys
-import traceback
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Protocol, Union
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, Union
+
+
+def _print_exc() -> None:
+    # traceback is only needed on error paths, so it is imported on demand
+    import traceback
+    traceback.print_exc()
+
 
 # ------------------------------
 # Plugin Interface Definition
@@ -87,6 +93,10 @@ class PluginManager:
         self.plugins: Dict[str, PluginMetadata] = {}
         # Hooks registry: event_name -> list of callables
         self.hooks: Dict[str, List[Callable[..., Any]]] = {}
+        # discover_plugins() results: directory -> (mtime_ns, module names)
+        self._discover_cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+        # Reverse hook index: plugin_name -> [(event_name, handler), ...]
+        self._plugin_hooks: Dict[str, List[Tuple[str, Callable[..., Any]]]] = {}
 
     def discover_plugins(self) -> List[str]:
         """
@@ -96,18 +106,33 @@ class PluginManager:
         """
         plugin_modules = []
         for directory in self.plugin_dirs:
-            if not os.path.isdir(directory):
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            # Adding, removing or renaming an entry bumps the directory mtime
+            cached = self._discover_cache.get(directory)
+            if cached is not None and cached[0] == mtime_ns:
+                plugin_modules.extend(cached[1])
+                continue
+
+            found = []
+            try:
+                # DirEntry.is_dir() usually answers without another stat
+                # on most platforms
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        if filename.endswith(".py") and not filename.startswith("_"):
+                            # Compose full module path relative to plugin directory
+                            found.append(f"plugins.{filename[:-3]}")
+                        elif entry.is_dir():
+                            # Package plugin assumed
+                            found.append(f"plugins.{filename}")
+            except NotADirectoryError:
                 continue
-            for filename in os.listdir(directory):
-                if filename.endswith(".py") and not filename.startswith("_"):
-                    mod_name = filename[:-3]
-                    # Compose full module path relative to plugin directory
-                    full_module_name = f"plugins.{mod_name}"
-                    plugin_modules.append(full_module_name)
-                elif os.path.isdir(os.path.join(directory, filename)):
-                    # Package plugin assumed
-                    full_module_name = f"plugins.{filename}"
-                    plugin_modules.append(full_module_name)
+            self._discover_cache[directory] = (mtime_ns, tuple(found))
+            plugin_modules.extend(found)
         return plugin_modules
 
     def load_plugin(self, module_name: str) -> bool:
@@ -119,7 +144,8 @@ class PluginManager:
             print(f"Plugin '{module_name}' already loaded.")
             return False
         try:
-            module = importlib.import_module(module_name)
+            # Already-imported modules skip the import machinery and its lock
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
             # Plugin module must expose `plugin` variable or factory function
             plugin_obj = getattr(module, "plugin", None)
             if plugin_obj is None:
@@ -150,7 +176,7 @@ class PluginManager:
 
         except Exception as e:
             print(f"Failed to load plugin '{module_name}': {e}")
-            traceback.print_exc()
+            _print_exc()
             return False
 
     def unload_plugin(self, plugin_name: str) -> bool:
@@ -167,14 +193,17 @@ class PluginManager:
             del self.plugins[plugin_name]
 
             # Remove hooks registered by this plugin
-            for event, handlers in self.hooks.items():
-                self.hooks[event] = [h for h in handlers if getattr(h, "__plugin_name__", None) != plugin_name]
+            for event, handler in self._plugin_hooks.pop(plugin_name, ()):
+                try:
+                    self.hooks[event].remove(handler)
+                except (KeyError, ValueError):
+                    pass  # already removed from the registry
 
             print(f"Unloaded plugin '{plugin_name}'.")
             return True
         except Exception as e:
             print(f"Failed to unload plugin '{plugin_name}': {e}")
-            traceback.print_exc()
+            _print_exc()
             return False
 
     def register_hook(self, event_name: str, handler: Callable[..., Any], plugin_name: Optional[str] = None) -> None:
@@ -185,9 +214,9 @@ class PluginManager:
         if event_name not in self.hooks:
             self.hooks[event_name] = []
 
-        # Tag handler with plugin_name for easy removal later
+        # Index by plugin_name for easy removal later
         if plugin_name:
-            setattr(handler, "__plugin_name__", plugin_name)
+            self._plugin_hooks.setdefault(plugin_name, []).append((event_name, handler))
 
         self.hooks[event_name].append(handler)
 
@@ -196,14 +225,18 @@ class PluginManager:
         Trigger all hooks registered to an event.
         Returns list of results from all handlers.
         """
+        handlers = self.hooks.get(event_name)
+        if not handlers:
+            # Most events have no subscribers
+            return []
         results = []
-        for handler in self.hooks.get(event_name, []):
+        append = results.append
+        for handler in handlers:
             try:
-                result = handler(*args, **kwargs)
-                results.append(result)
+                append(handler(*args, **kwargs))
             except Exception as e:
                 print(f"Error in plugin hook for event '{event_name}': {e}")
-                traceback.print_exc()
+                _print_exc()
         return results
 
     def list_plugins(self) -> List[str]:
@@ -227,7 +260,7 @@ class PluginManager:
             return self.load_plugin(module_name)
         except Exception as e:
             print(f"Failed to reload plugin '{plugin_name}': {e}")
-            traceback.print_exc()
+            _print_exc()
             return False
 
 
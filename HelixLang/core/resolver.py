@@ -0,0 +1,185 @@
+# resolver.py
+
+from typing import Dict, List, Optional
+
+from ast_nodes import *
+
+
+class Resolver(ASTVisitor):
+    """
+    Static pass run before interpretation that binds every local variable
+    reference to a (depth, slot) pair: how many scopes to walk up from the
+    current environment and the index into that environment's slot list.
+
+    Scopes mirror exactly the environments the Interpreter creates:
+    one per block, one per for-loop, and one per function call holding the
+    parameters followed by the locals of the function's top-level block.
+    Names not found in any enclosing local scope are left unresolved
+    (depth None) and looked up in the global dict at runtime.
+
+    Function bodies are resolved after the rest of the enclosing function
+    (or of the resolved tree), against the scopes that enclosed the
+    definition. A body runs only once it is called, by which time the
+    enclosing scopes hold every name they declare, so a local declared
+    after a nested function is still visible to it.
+
+    Results are stored on the nodes themselves (VariableNode.depth/slot,
+    *.slot on declarations, scope_size on blocks and loops, local_names and
+    local_count on function definitions).
+    """
+
+    def __init__(self):
+        self.scopes: List[Dict[str, int]] = []  # name -> slot, innermost last
+        self.sizes: List[int] = []  # slots allocated in each scope
+        # (definition, enclosing scopes) whose bodies are still to be resolved
+        self._pending: List[tuple] = []
+
+    def resolve(self, node: ASTNode) -> None:
+        pending = self._pending
+        self._pending = []
+        try:
+            node.accept(self)
+            self._resolve_pending()
+        finally:
+            self._pending = pending
+
+    def _resolve_pending(self) -> None:
+        # Bodies queue their own nested definitions on a fresh list, which
+        # _resolve_function_body drains before returning
+        for node, scopes in self._pending:
+            self._resolve_function_body(node, scopes)
+
+    # --- Scope helpers ---
+
+    def _begin_scope(self, names: Optional[Dict[str, int]] = None, size: int = 0) -> None:
+        self.scopes.append(names if names is not None else {})
+        self.sizes.append(size)
+
+    def _end_scope(self) -> int:
+        """Pop the innermost scope and return its slot count."""
+        self.scopes.pop()
+        return self.sizes.pop()
+
+    def _declare(self, name: str) -> Optional[int]:
+        """Allocate (or reuse, on redeclaration) a slot in the innermost scope."""
+        if not self.scopes:
+            return None  # global
+        scope = self.scopes[-1]
+        slot = scope.get(name)
+        if slot is None:
+            slot = scope[name] = self.sizes[-1]
+            self.sizes[-1] += 1
+        return slot
+
+    def _resolve_statements(self, statements: list) -> None:
+        # Functions are declared up front so local functions can call each other
+        for stmt in statements:
+            if isinstance(stmt, FunctionDefNode):
+                self._declare(stmt.name)
+        for stmt in statements:
+            stmt.accept(self)
+
+    def _bind(self, node: VariableNode) -> None:
+        for depth, scope in enumerate(reversed(self.scopes)):
+            slot = scope.get(node.name)
+            if slot is not None:
+                node.depth = depth
+                node.slot = slot
+                return
+        node.depth = None
+        node.slot = None
+
+    # --- Expression Visitors ---
+
+    def visit_literal(self, node: LiteralNode):
+        pass
+
+    def visit_variable(self, node: VariableNode):
+        self._bind(node)
+
+    def visit_binary_op(self, node: BinaryOpNode):
+        node.left.accept(self)
+        node.right.accept(self)
+
+    def visit_unary_op(self, node: UnaryOpNode):
+        node.operand.accept(self)
+
+    def visit_call(self, node: CallNode):
+        node.callee.accept(self)
+        for arg in node.arguments:
+            arg.accept(self)
+
+    # --- Statement Visitors ---
+
+    def visit_variable_decl(self, node: VariableDeclNode):
+        # Initializer first, so `let x = x` refers to an outer x
+        if node.initializer:
+            node.initializer.accept(self)
+        node.slot = self._declare(node.name)
+
+    def visit_assignment(self, node: AssignmentNode):
+        node.value.accept(self)
+        self._bind(node.target)
+
+    def visit_block(self, node: BlockNode):
+        self._begin_scope()
+        self._resolve_statements(node.statements)
+        node.scope_size = self._end_scope()
+
+    def visit_if(self, node: IfNode):
+        node.condition.accept(self)
+        node.then_branch.accept(self)
+        if node.else_branch:
+            node.else_branch.accept(self)
+
+    def visit_while(self, node: WhileNode):
+        node.condition.accept(self)
+        node.body.accept(self)
+
+    def visit_for(self, node: ForNode):
+        self._begin_scope()
+        node.initializer.accept(self)
+        node.condition.accept(self)
+        node.increment.accept(self)
+        node.body.accept(self)
+        node.scope_size = self._end_scope()
+
+    def visit_return(self, node: ReturnNode):
+        if node.value:
+            node.value.accept(self)
+
+    def visit_function_def(self, node: FunctionDefNode):
+        node.slot = self._declare(node.name)
+        # The scope dicts are shared, not copied: names the enclosing scopes
+        # declare later are in them by the time the body is resolved
+        self._pending.append((node, list(self.scopes)))
+
+    def _resolve_function_body(self, node: FunctionDefNode, scopes: List[Dict[str, int]]) -> None:
+        outer_scopes, outer_sizes, outer_pending = self.scopes, self.sizes, self._pending
+        # Slot counts of the enclosing scopes are final; the body only
+        # allocates in scopes of its own
+        self.scopes, self.sizes, self._pending = list(scopes), [0] * len(scopes), []
+        try:
+            # Parameters occupy slots 0..arity-1 of the call environment; the
+            # body's own block shares that frame instead of opening another scope
+            scope = {name: i for i, name in enumerate(node.params)}
+            self._begin_scope(scope, len(node.params))
+            body = node.body
+            if isinstance(body, BlockNode):
+                self._resolve_statements(body.statements)
+            else:
+                body.accept(self)
+            node.local_count = self._end_scope()
+            self._resolve_pending()
+        finally:
+            self.scopes, self.sizes, self._pending = outer_scopes, outer_sizes, outer_pending
+        local_names = [None] * node.local_count  # None for shadowed duplicate params
+        for name, slot in scope.items():
+            local_names[slot] = name
+        node.local_names = tuple(local_names)
+
+    def visit_struct_def(self, node: StructDefNode):
+        node.slot = self._declare(node.name)
+
+    def visit_import(self, node: ImportNode):
+        pass
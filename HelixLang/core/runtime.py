@@ -1,18 +1,24 @@
 # runtime.py
 
-from collections import deque
+import sys
 
 class RuntimeError(Exception):
     """Runtime errors during execution of HelixLang code."""
+    __slots__ = ('node',)
+
     def __init__(self, message, node=None):
         super().__init__(message)
         self.node = node
 
 class Function:
     """Represents a user-defined function in HelixLang."""
+    __slots__ = ('name', 'params', 'body', 'closure_env')
+
     def __init__(self, name, params, body, closure_env):
-        self.name = name
-        self.params = params  # list of parameter names
+        self.name = sys.intern(name)
+        # Interned once here rather than on every call that binds them, so
+        # environment dicts are keyed by the same objects the lookups use
+        self.params = [sys.intern(p) for p in params]  # list of parameter names
         self.body = body      # AST or IR representing function body
         self.closure_env = closure_env  # Environment where function was defined
 
@@ -20,33 +26,58 @@ class Function:
         return f"<Function {self.name}({', '.join(self.params)})>"
 
 class Environment:
-    """Represents a variable scope."""
-    def __init__(self, parent=None):
+    """
+    Represents a variable scope.
+
+    Locals bound by the resolver live in `slots` and are reached with
+    get_at/set_at using the (depth, slot) pair stored on the AST; `values`
+    holds names the resolver leaves unbound (globals, natives, REPL input).
+    """
+    __slots__ = ('values', 'slots', 'parent')
+
+    def __init__(self, parent=None, size=0):
         self.values = {}
+        self.slots = [None] * size
         self.parent = parent
 
+    def get_at(self, depth, slot):
+        env = self
+        for _ in range(depth):
+            env = env.parent
+        return env.slots[slot]
+
+    def set_at(self, depth, slot, value):
+        env = self
+        for _ in range(depth):
+            env = env.parent
+        env.slots[slot] = value
+
     def get(self, name):
-        if name in self.values:
-            return self.values[name]
-        elif self.parent:
-            return self.parent.get(name)
-        else:
-            raise RuntimeError(f"Undefined variable '{name}'")
+        env = self
+        while env is not None:
+            values = env.values
+            if name in values:
+                return values[name]
+            env = env.parent
+        raise RuntimeError(f"Undefined variable '{name}'")
 
     def set(self, name, value):
-        if name in self.values:
-            self.values[name] = value
-        elif self.parent:
-            self.parent.set(name, value)
-        else:
-            # If variable not found in any parent, define it in current
-            self.values[name] = value
+        env = self
+        while env is not None:
+            if name in env.values:
+                env.values[name] = value
+                return
+            env = env.parent
+        # If variable not found in any parent, define it in current
+        self.values[name] = value
 
     def define(self, name, value):
         self.values[name] = value
 
 class Frame:
     """Represents a single call frame."""
+    __slots__ = ('func', 'env', 'return_value', 'is_returning')
+
     def __init__(self, func, env):
         self.func = func        # Function object
         self.env = env          # Environment for local variables
@@ -56,7 +87,10 @@ class Frame:
 class Runtime:
     def __init__(self):
         self.global_env = Environment()
-        self.call_stack = deque()
+        # Frames indexed by call depth; only _frames[:_sp] are live; the
+        # entries above are idle frames kept for reuse (see push_frame())
+        self._frames = []
+        self._sp = 0
         self.native_functions = {}
 
         # Initialize with built-in/native functions
@@ -72,21 +106,56 @@ class Runtime:
             raise RuntimeError(f"Expected {len(func.params)} arguments but got {len(args)}.")
         for name, val in zip(func.params, args):
             env.define(name, val)
-        frame = Frame(func, env)
-        self.call_stack.append(frame)
+        # Frames are bump-allocated by depth: the slot above the stack top
+        # is reused if an earlier call reached it, so popping a frame is
+        # just moving _sp back and deep call chains allocate once
+        frames = self._frames
+        sp = self._sp
+        if sp < len(frames):
+            frame = frames[sp]
+            frame.func = func
+            frame.env = env
+            frame.return_value = None
+            frame.is_returning = False
+        else:
+            frame = Frame(func, env)
+            frames.append(frame)
+        self._sp = sp + 1
         return frame
 
     def pop_frame(self):
-        """Remove the top call frame."""
-        return self.call_stack.pop()
+        """
+        Remove the top call frame and return it. The Frame object is reused
+        by the next push_frame() at the same depth, which overwrites it:
+        read what you need from it before pushing another frame.
+        """
+        if not self._sp:
+            raise IndexError("pop from empty call stack")
+        self._sp -= 1
+        return self._frames[self._sp]
+
+    @property
+    def call_stack(self):
+        """The live call frames, outermost first (a copy; idle frames excluded)."""
+        return self._frames[:self._sp]
+
+    def _release_frame(self, frame):
+        """
+        Drop what a popped frame references once nothing reads it any more,
+        so an idle frame slot does not keep its last call's values alive.
+        Only the Frame is reused: its Environment may still be referenced
+        by closures created during the call.
+        """
+        frame.func = frame.env = frame.return_value = None
+        frame.is_returning = False
 
     def current_frame(self):
-        if not self.call_stack:
+        if not self._sp:
             return None
-        return self.call_stack[-1]
+        return self._frames[self._sp - 1]
 
     def define_global(self, name, value):
-        self.global_env.define(name, value)
+        self.global_env.define(sys.intern(name), value)
 
     def get_variable(self, name):
         # Check current frame env first, then globals
@@ -119,9 +188,10 @@ class Runtime:
                 # interpreter.execute(func.body)
                 # For simplicity, function body execution is deferred or replaced
                 raise NotImplementedError("Function execution not implemented yet")
+                return frame.return_value
             finally:
                 self.pop_frame()
-            return frame.return_value
+                self._release_frame(frame)
         elif callable(func):
             # Native function
             return func(*args)
@@ -130,6 +200,7 @@ class Runtime:
 
     # Native functions registration
     def register_native_function(self, name, func):
+        name = sys.intern(name)
         self.global_env.define(name, func)
         self.native_functions[name] = func
 
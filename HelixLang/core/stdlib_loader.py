@@ -1,8 +1,17 @@
 # stdlib_loader.py
 
 import os
-from typing import List, Dict, Optional
-from helixlang import parser, compiler, symbols, errors
+import pickle
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
+from helixlang import parser, compiler, symbols, errors, version
+
+logger = logging.getLogger("helixlang.stdlib_loader")
+
+# Parsed and compiled form of `base.hl` is cached next to it as `base.hl.hlc`
+CACHE_SUFFIX = ".hlc"
 
 class StdLibLoader:
     """
@@ -33,14 +42,14 @@ class StdLibLoader:
         Discover all HelixLang stdlib source files (.hl) in the stdlib directory.
         Populates self.files_to_load with absolute file paths.
         """
-        if not os.path.isdir(self.stdlib_path):
+        # scandir entries carry the name, full path and file type from the
+        # directory read itself, so no per-file stat is needed
+        try:
+            with os.scandir(self.stdlib_path) as entries:
+                files = [entry.path for entry in entries
+                         if entry.name.endswith(".hl") and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             raise errors.RuntimeError(f"Stdlib directory not found at {self.stdlib_path}")
-
-        files = []
-        for filename in os.listdir(self.stdlib_path):
-            if filename.endswith(".hl"):
-                full_path = os.path.join(self.stdlib_path, filename)
-                files.append(full_path)
         if not files:
             raise errors.RuntimeError(f"No stdlib source files (.hl) found in {self.stdlib_path}")
 
@@ -55,29 +64,101 @@ class StdLibLoader:
         """
         self.discover_files()
 
-        for filepath in self.files_to_load:
-            module_name = self._extract_module_name(filepath)
+        # Reading, parsing and compiling a file touches no shared state, so
+        # files are loaded concurrently; symbols are still extracted and
+        # injected one module at a time, in file order
+        with ThreadPoolExecutor() as pool:
+            loads = [pool.submit(self._load_file, filepath) for filepath in self.files_to_load]
+            for filepath, load in zip(self.files_to_load, loads):
+                self._integrate_module(global_symbol_table, filepath, load)
+
+    def _load_file(self, filepath: str) -> Tuple[Any, Any]:
+        """
+        Read, parse and compile one stdlib file. Runs in a worker thread.
+        Parsing and compiling are skipped when the file's cache is fresh.
+
+        Returns:
+            (AST root node, IR) for the file.
+        """
+        source_code = self._read_source(filepath)
+        digest = hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+        cached = self._read_cache(filepath, digest)
+        if cached is not None:
+            return cached
+        ast_root = self._parse_source(source_code, filepath)
+        ir = self._compile_ast(ast_root)
+        self._write_cache(filepath, digest, ast_root, ir)
+        return ast_root, ir
+
+    def _read_cache(self, filepath: str, digest: str) -> Optional[Tuple[Any, Any]]:
+        """
+        Load (AST, IR) from the file's cache if it was written for this exact
+        source (SHA-256 digest) by this HelixLang version.
+
+        Returns:
+            The cached (AST root node, IR), or None if there is no usable cache.
+        """
+        try:
+            with open(filepath + CACHE_SUFFIX, 'rb') as f:
+                # The header is a pickle of its own, so a stale cache is
+                # rejected without unpickling the whole tree
+                if pickle.load(f) != (digest, version.VERSION_STRING):
+                    return None
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # truncated, corrupt or from incompatible classes
+            logger.debug(f"Ignoring stdlib cache for '{filepath}': {e}")
+            return None
+
+    def _write_cache(self, filepath: str, digest: str, ast_root, ir) -> None:
+        """
+        Write the file's cache. Failures (read-only stdlib directory,
+        unpicklable nodes) only cost the next startup a recompile.
+        """
+        cache_path = filepath + CACHE_SUFFIX
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((digest, version.VERSION_STRING), f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump((ast_root, ir), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)  # readers never see a partial file
+        except Exception as e:
+            logger.debug(f"Could not write stdlib cache for '{filepath}': {e}")
             try:
-                source_code = self._read_source(filepath)
-                ast_root = self._parse_source(source_code, filepath)
-                ir = self._compile_ast(ast_root)
-                module_symbols = self._extract_symbols(ast_root, global_symbol_table)
-
-                # Inject symbols into the global symbol table
-                self._inject_symbols(global_symbol_table, module_symbols)
-
-                # Cache loaded module info
-                self.loaded_modules[module_name] = {
-                    'ast': ast_root,
-                    'ir': ir,
-                    'symbols': module_symbols,
-                    'filepath': filepath,
-                }
-
-                print(f"[StdLibLoader] Loaded stdlib module '{module_name}' from '{filepath}'")
-
-            except (errors.SyntaxError, errors.RuntimeError, errors.TypeError) as e:
-                raise errors.RuntimeError(f"Failed to load stdlib module '{module_name}': {e}")
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _integrate_module(self, global_symbol_table: symbols.SymbolTable, filepath: str, load) -> None:
+        """
+        Wait for a file's load and add its symbols and module entry.
+
+        Args:
+            global_symbol_table: The global symbol table to inject symbols into.
+            filepath: The stdlib file the load was started for.
+            load: Future resolving to _load_file(filepath).
+        """
+        module_name = self._extract_module_name(filepath)
+        try:
+            ast_root, ir = load.result()
+            module_symbols = self._extract_symbols(ast_root, global_symbol_table)
+
+            # Inject symbols into the global symbol table
+            self._inject_symbols(global_symbol_table, module_symbols)
+
+            # Cache loaded module info
+            self.loaded_modules[module_name] = {
+                'ast': ast_root,
+                'ir': ir,
+                'symbols': module_symbols,
+                'filepath': filepath,
+            }
+
+            logger.debug(f"Loaded stdlib module '{module_name}' from '{filepath}'")
+
+        except (errors.SyntaxError, errors.RuntimeError, errors.TypeError) as e:
+            raise errors.RuntimeError(f"Failed to load stdlib module '{module_name}': {e}")
 
     def _extract_module_name(self, filepath: str) -> str:
         """
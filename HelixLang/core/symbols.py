@@ -1,11 +1,21 @@
+import sys
+import logging
 from typing import Optional, Dict, List, Union, Any
 
+logger = logging.getLogger("helixlang.symbols")
+
+
+# Marks a name missing from SymbolTable's lookup cache (None caches "not found")
+_MISSING = object()
+
 
 class Symbol:
     """
     Represents a symbol entry in the symbol table.
     Contains metadata about the symbol: name, type, scope level, mutability, visibility, etc.
     """
+    # Tables can hold tens of thousands of symbols; no per-instance __dict__
+    __slots__ = ('name', 'type', 'scope_level', 'is_mutable', 'is_global', 'is_function', '_metadata')
 
     def __init__(
         self,
@@ -17,13 +27,25 @@ class Symbol:
         is_function: bool = False,
         metadata: Optional[Dict[str, Any]] = None,
     ):
-        self.name = name
+        # Interned: scope dicts are keyed by this string, and lookups with
+        # tokenizer/AST names (also interned) then match on identity
+        self.name = sys.intern(name)
         self.type = typ
         self.scope_level = scope_level
         self.is_mutable = is_mutable
         self.is_global = is_global
         self.is_function = is_function
-        self.metadata = metadata or {}
+        self._metadata = metadata or None  # dict created on first use, see metadata
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]):
+        self._metadata = value
 
     def __repr__(self):
         return (f"Symbol(name={self.name}, type={self.type}, scope={self.scope_level}, "
@@ -34,6 +56,7 @@ class Scope:
     """
     Represents a single scope frame, mapping symbol names to Symbol objects.
     """
+    __slots__ = ('level', 'symbols')
 
     def __init__(self, level: int):
         self.level = level
@@ -62,21 +85,28 @@ class SymbolTable:
     """
     Manages a stack of scopes to support nested scoping rules.
     Provides insertion and lookup operations with shadowing.
+
+    Lookup results are cached per name until a symbol is inserted or a
+    scope is exited, so symbols must be added through insert() rather than
+    on a Scope directly.
     """
 
     def __init__(self):
         self.scopes: List[Scope] = []
         self.current_level: int = -1
+        self._lookup_cache: Dict[str, Optional[Symbol]] = {}
         self.enter_scope()  # initialize global scope
 
     def enter_scope(self) -> None:
         """
         Push a new scope onto the stack.
+        The new scope is empty, so cached lookups stay valid.
         """
         self.current_level += 1
         scope = Scope(self.current_level)
         self.scopes.append(scope)
-        print(f"Entered new scope level {self.current_level}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Entered new scope level {self.current_level}")
 
     def exit_scope(self) -> None:
         """
@@ -85,7 +115,9 @@ class SymbolTable:
         if self.current_level < 0:
             raise RuntimeError("No scope to exit.")
         popped = self.scopes.pop()
-        print(f"Exited scope level {popped.level} with symbols: {list(popped.symbols.keys())}")
+        self._lookup_cache.clear()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Exited scope level {popped.level} with symbols: {list(popped.symbols.keys())}")
         self.current_level -= 1
 
     def insert(
@@ -103,7 +135,9 @@ class SymbolTable:
         """
         symbol = Symbol(name, typ, self.current_level, is_mutable, is_global, is_function, metadata)
         self.scopes[self.current_level].insert(symbol)
-        print(f"Inserted symbol '{name}' at scope level {self.current_level}")
+        self._lookup_cache.clear()  # may shadow or define a cached name
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Inserted symbol '{name}' at scope level {self.current_level}")
         return symbol
 
     def lookup(self, name: str) -> Optional[Symbol]:
@@ -111,13 +145,20 @@ class SymbolTable:
         Lookup a symbol by name, starting from innermost scope to outermost.
         Returns the closest shadowed symbol or None if not found.
         """
-        for scope in reversed(self.scopes):
-            symbol = scope.lookup(name)
+        symbol = self._lookup_cache.get(name, _MISSING)
+        if symbol is _MISSING:
+            symbol = None
+            for scope in reversed(self.scopes):
+                symbol = scope.lookup(name)
+                if symbol:
+                    break
+            self._lookup_cache[name] = symbol
+        if logger.isEnabledFor(logging.DEBUG):
             if symbol:
-                print(f"Found symbol '{name}' at scope level {scope.level}")
-                return symbol
-        print(f"Symbol '{name}' not found in any scope.")
-        return None
+                logger.debug(f"Found symbol '{name}' at scope level {symbol.scope_level}")
+            else:
+                logger.debug(f"Symbol '{name}' not found in any scope.")
+        return symbol
 
     def current_scope(self) -> Scope:
         """
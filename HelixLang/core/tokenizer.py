@@ -1,7 +1,11 @@
-from enum import Enum, auto
+import re
+import sys
+from enum import IntEnum, auto
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # IntEnum so members hash and compare as plain ints; the parser keys
+    # its precedence and literal tables on token types
     # Keywords
     IF = auto()
     WHILE = auto()
@@ -47,8 +51,19 @@ KEYWORDS = {
     "let": TokenType.LET,
 }
 
+# Identifier text -> token type: keywords map to their own type, every
+# other name to IDENTIFIER. One dict probe per identifier; the tokenizer
+# interns short names, so the probe compares by identity on a cached hash.
+_keyword_type = KEYWORDS.get
+
+# Identifiers up to this length are interned by the tokenizer
+MAX_INTERN_LENGTH = 16
+
 
 class Token:
+    # One per token, so no per-instance __dict__
+    __slots__ = ('type', 'value', 'line', 'column')
+
     def __init__(self, type_, value, line, column):
         self.type = type_
         self.value = value
@@ -63,20 +78,123 @@ class TokenizerError(Exception):
     pass
 
 
+# Characters read per refill when tokenizing from a stream
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Escape character (after the backslash) -> replacement; unknown escapes
+# stand for the character itself
+ESCAPES = {
+    'n': '\n',
+    't': '\t',
+    '"': '"',
+    "'": "'",
+    '\\': '\\',
+    'r': '\r',
+}
+
+# String literal bodies up to (not including) the closing quote, scanned in C
+STRING_BODY_PATTERNS = {
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL),
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL),
+}
+ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+
+# Rest of an identifier after its first character
+IDENTIFIER_TAIL_PATTERN = re.compile(r'\w*')
+
+# Operator and punctuation text -> token type
+OPERATOR_TOKENS = {
+    '==': TokenType.EQEQ,
+    '!=': TokenType.NEQ,
+    '<=': TokenType.LTE,
+    '>=': TokenType.GTE,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.STAR,
+    '/': TokenType.SLASH,
+    '=': TokenType.EQ,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '!': TokenType.BANG,
+}
+PUNCTUATION_TOKENS = {
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+}
+SYMBOL_TOKENS = {**OPERATOR_TOKENS, **PUNCTUATION_TOKENS}
+
+# Master pattern for Tokenizer.tokenize(): leading whitespace, then at most
+# one token or comment, one group per class (the group number is the
+# match's lastindex, None when only whitespace matched). It only covers the
+# common ASCII forms; anything it does not match (non-ASCII input,
+# unterminated strings and block comments, stray characters) is handed to
+# the char-by-char methods, which also produce the error messages.
+_LINE_COMMENT, _BLOCK_COMMENT, _IDENTIFIER, _NUMBER, _STRING_DQ, _STRING_SQ, _SYMBOL = range(1, 8)
+TOKEN_PATTERN = re.compile(r"""
+    [ \t\n\r]*
+    (?:
+        (//[^\n]*)
+      | (/\*.*?\*/)
+      | ([A-Za-z_]\w*)
+      | ([0-9][0-9.]*)(?![0-9.]|[^\x00-\x7f])
+      | "([^"\\]*(?:\\.[^"\\]*)*)"
+      | '([^'\\]*(?:\\.[^'\\]*)*)'
+      | (==|!=|<=|>=|[-+*=!<>(){},;]|/(?!\*))
+    )?
+""", re.VERBOSE | re.DOTALL)
+
+
+def _unescape(match):
+    c = match.group(1)
+    return ESCAPES.get(c, c)
+
+
 class Tokenizer:
-    def __init__(self, source_code: str):
-        self.source = source_code
-        self.position = 0
+    def __init__(self, source_code):
+        """
+        source_code: the source text, or a text stream (e.g. an open file)
+        that is consumed in STREAM_CHUNK_SIZE chunks so the whole file never
+        has to be resident at once.
+        """
+        if isinstance(source_code, str):
+            self.source = source_code
+            self._stream = None
+        else:
+            self.source = ""
+            self._stream = source_code
+        self.position = 0  # index into self.source (the current window when streaming)
         self.line = 1
         self.column = 1
+        if self._stream is not None:
+            self._refill()
         self.current_char = self.source[self.position] if self.source else None
 
+    def _refill(self):
+        """
+        Drop consumed input and append the next chunk from the stream.
+        Returns False once the stream is exhausted.
+        """
+        chunk = self._stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            self._stream = None
+            return False
+        self.source = self.source[self.position:] + chunk
+        self.position = 0
+        return True
+
     def advance(self):
         if self.current_char == '\n':
             self.line += 1
             self.column = 0
         self.position += 1
         self.column += 1
+        # Keep one character of lookahead available for peek()
+        if self._stream is not None and self.position + 1 >= len(self.source):
+            self._refill()
         if self.position < len(self.source):
             self.current_char = self.source[self.position]
         else:
@@ -84,34 +202,119 @@ class Tokenizer:
 
     def peek(self, offset=1):
         peek_pos = self.position + offset
+        while peek_pos >= len(self.source) and self._stream is not None:
+            if not self._refill():
+                break
+            peek_pos = self.position + offset
         if peek_pos < len(self.source):
             return self.source[peek_pos]
         return None
 
     def tokenize(self):
+        """
+        Scan the input with TOKEN_PATTERN, one regex match per token plus
+        its leading whitespace. The position, line and the index where the
+        current line starts (column = position - line_start + 1) are kept
+        in locals and only written back when input is handed to the
+        char-by-char methods.
+        """
         tokens = []
-        while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-            elif self.current_char == '/' and self.peek() == '/':
-                self.skip_line_comment()
-            elif self.current_char == '/' and self.peek() == '*':
-                self.skip_block_comment()
-            elif self.current_char.isalpha() or self.current_char == '_':
-                tokens.append(self.tokenize_identifier_or_keyword())
-            elif self.current_char.isdigit():
-                tokens.append(self.tokenize_number())
-            elif self.current_char == '"' or self.current_char == "'":
-                tokens.append(self.tokenize_string())
-            elif self.current_char in ('+', '-', '*', '/', '=', '!', '<', '>'):
-                tokens.append(self.tokenize_operator())
-            elif self.current_char in ('(', ')', '{', '}', ',', ';'):
-                tokens.append(self.tokenize_punctuation())
+        append = tokens.append
+        match = TOKEN_PATTERN.match
+        make_token = Token
+        classify = _keyword_type
+        identifier = TokenType.IDENTIFIER
+        number, string = TokenType.NUMBER, TokenType.STRING
+        source = self.source
+        pos, line = self.position, self.line
+        line_start = pos - self.column + 1
+        while pos < len(source) or self._stream is not None:
+            m = match(source, pos)
+            end = m.end()
+            if end == len(source) and self._stream is not None:
+                # The match may continue in the next chunk; refill and rescan
+                self.position = pos
+                if self._refill():
+                    line_start -= pos
+                source, pos = self.source, self.position
+                continue
+
+            kind = m.lastindex
+            start = m.start(kind) if kind is not None else end
+            if start != pos:
+                newline = source.rfind('\n', pos, start)
+                if newline >= 0:
+                    line += source.count('\n', pos, newline + 1)
+                    line_start = newline + 1
+
+            if kind == _IDENTIFIER:
+                ident_str = m.group(kind)
+                if len(ident_str) <= MAX_INTERN_LENGTH and ident_str.isascii():
+                    ident_str = sys.intern(ident_str)
+                append(make_token(classify(ident_str, identifier), ident_str, line, start - line_start + 1))
+            elif kind == _SYMBOL:
+                text = m.group(kind)
+                append(make_token(SYMBOL_TOKENS[text], text, line, start - line_start + 1))
+            elif kind == _NUMBER:
+                num_value = m.group(kind)
+                if '.' in num_value:
+                    second_dot = num_value.find('.', num_value.index('.') + 1)
+                    if second_dot >= 0:
+                        self.line, self.column = line, start + second_dot - line_start + 1
+                        self.error("Malformed number literal with multiple decimal points")
+                    val = float(num_value)
+                else:
+                    val = int(num_value)
+                append(make_token(number, val, line, start - line_start + 1))
+            elif kind is None:
+                if end < len(source):
+                    # Not a fast-path token: let the char-by-char methods take it
+                    self.position, self.line, self.column = end, line, end - line_start + 1
+                    self.current_char = source[end]
+                    self._tokenize_slow(tokens)
+                    source = self.source
+                    pos, line = self.position, self.line
+                    line_start = pos - self.column + 1
+                    continue
             else:
-                self.error(f"Unexpected character '{self.current_char}'")
+                if kind == _STRING_DQ or kind == _STRING_SQ:
+                    raw = m.group(kind)
+                    value = ESCAPE_PATTERN.sub(_unescape, raw) if '\\' in raw else raw
+                    # The group is the body; the token starts at the quote
+                    append(make_token(string, value, line, start - line_start))
+                # Strings and block comments may span lines
+                newline = source.rfind('\n', start, end)
+                if newline >= 0:
+                    line += source.count('\n', start, newline + 1)
+                    line_start = newline + 1
+            pos = end
+
+        self.position, self.line, self.column = pos, line, pos - line_start + 1
+        self.current_char = None
         tokens.append(Token(TokenType.EOF, None, self.line, self.column))
         return tokens
 
+    def _tokenize_slow(self, tokens):
+        """Scan one token (or skip whitespace/a comment) character by character."""
+        if self.current_char.isspace():
+            self.skip_whitespace()
+        elif self.current_char == '/' and self.peek() == '/':
+            self.skip_line_comment()
+        elif self.current_char == '/' and self.peek() == '*':
+            self.skip_block_comment()
+        elif self.current_char.isalpha() or self.current_char == '_':
+            tokens.append(self.tokenize_identifier_or_keyword())
+        elif self.current_char.isdigit():
+            tokens.append(self.tokenize_number())
+        elif self.current_char == '"' or self.current_char == "'":
+            tokens.append(self.tokenize_string())
+        elif self.current_char in OPERATOR_TOKENS:
+            tokens.append(self.tokenize_operator())
+        elif self.current_char in PUNCTUATION_TOKENS:
+            tokens.append(self.tokenize_punctuation())
+        else:
+            self.error(f"Unexpected character '{self.current_char}'")
+
     def skip_whitespace(self):
         while self.current_char is not None and self.current_char.isspace():
             self.advance()
@@ -139,13 +342,21 @@ class Tokenizer:
 
     def tokenize_identifier_or_keyword(self):
         line, column = self.line, self.column
-        ident = []
-        while self.current_char is not None and (self.current_char.isalnum() or self.current_char == '_'):
-            ident.append(self.current_char)
-            self.advance()
-        ident_str = ''.join(ident)
-        token_type = KEYWORDS.get(ident_str, TokenType.IDENTIFIER)
-        return Token(token_type, ident_str, line, column)
+        # \w is exactly str.isalnum() plus '_'; scan the name in one match,
+        # pulling more input while it runs into the end of a streamed window
+        while True:
+            start = self.position
+            end = IDENTIFIER_TAIL_PATTERN.match(self.source, start + 1).end()
+            if self._stream is None or end < len(self.source):
+                break
+            self._refill()
+        ident_str = self.source[start:end]
+        self._skip_to(end)
+        # Short ASCII names (all keywords, most identifiers) are interned so the
+        # keyword lookup and later name comparisons hit on identity
+        if len(ident_str) <= MAX_INTERN_LENGTH and ident_str.isascii():
+            ident_str = sys.intern(ident_str)
+        return Token(_keyword_type(ident_str, TokenType.IDENTIFIER), ident_str, line, column)
 
     def tokenize_number(self):
         line, column = self.line, self.column
@@ -178,35 +389,50 @@ class Tokenizer:
     def tokenize_string(self):
         line, column = self.line, self.column
         quote_char = self.current_char
-        self.advance()  # consume opening quote
-        string_chars = []
-        while self.current_char is not None and self.current_char != quote_char:
-            if self.current_char == '\\':
-                self.advance()
-                if self.current_char is None:
-                    self.error("Unterminated string literal")
-                escape_char = self.handle_escape()
-                string_chars.append(escape_char)
-            else:
-                string_chars.append(self.current_char)
-                self.advance()
-        if self.current_char != quote_char:
+        body_pattern = STRING_BODY_PATTERNS[quote_char]
+
+        # Match the whole body at once; when streaming, pull more input while
+        # the match runs into the end of the buffered window
+        while True:
+            start = self.position + 1
+            end = body_pattern.match(self.source, start).end()
+            if self._stream is None or end + 1 < len(self.source):
+                break
+            self._refill()
+        if end >= len(self.source) or self.source[end] != quote_char:
+            # Report at end of input, where a char-by-char scan would stop
+            self._skip_to(len(self.source))
             self.error("Unterminated string literal")
-        self.advance()  # consume closing quote
-        return Token(TokenType.STRING, ''.join(string_chars), line, column)
+
+        raw = self.source[start:end]
+        value = ESCAPE_PATTERN.sub(_unescape, raw) if '\\' in raw else raw
+        self._skip_to(end + 1)  # past the closing quote
+        return Token(TokenType.STRING, value, line, column)
+
+    def _skip_to(self, position):
+        """
+        Move to `position` in the current window in one step, updating
+        line/column exactly as the equivalent advance() calls would.
+        """
+        consumed = self.source[self.position:position]
+        newlines = consumed.count('\n')
+        if newlines:
+            self.line += newlines
+            self.column = len(consumed) - consumed.rfind('\n')
+        else:
+            self.column += len(consumed)
+        self.position = position
+        if self._stream is not None and self.position + 1 >= len(self.source):
+            self._refill()
+        if self.position < len(self.source):
+            self.current_char = self.source[self.position]
+        else:
+            self.current_char = None
 
     def handle_escape(self):
-        escapes = {
-            'n': '\n',
-            't': '\t',
-            '"': '"',
-            "'": "'",
-            '\\': '\\',
-            'r': '\r',
-        }
         c = self.current_char
         self.advance()
-        return escapes.get(c, c)  # default to the char itself if unknown escape
+        return ESCAPES.get(c, c)  # default to the char itself if unknown escape
 
     def tokenize_operator(self):
         line, column = self.line, self.column
@@ -232,35 +458,16 @@ class Tokenizer:
             return Token(TokenType.GTE, '>=', line, column)
 
         # Single-char operators
-        single_char_tokens = {
-            '+': TokenType.PLUS,
-            '-': TokenType.MINUS,
-            '*': TokenType.STAR,
-            '/': TokenType.SLASH,
-            '=': TokenType.EQ,
-            '<': TokenType.LT,
-            '>': TokenType.GT,
-            '!': TokenType.BANG,
-        }
-
-        if c in single_char_tokens:
+        if c in OPERATOR_TOKENS:
             self.advance()
-            return Token(single_char_tokens[c], c, line, column)
+            return Token(OPERATOR_TOKENS[c], c, line, column)
 
         self.error(f"Unknown operator {c}")
 
     def tokenize_punctuation(self):
         line, column = self.line, self.column
         c = self.current_char
-        punct_tokens = {
-            '(': TokenType.LPAREN,
-            ')': TokenType.RPAREN,
-            '{': TokenType.LBRACE,
-            '}': TokenType.RBRACE,
-            ',': TokenType.COMMA,
-            ';': TokenType.SEMICOLON,
-        }
-        token_type = punct_tokens[c]
+        token_type = PUNCTUATION_TOKENS[c]
         self.advance()
         return Token(token_type, c, line, column)
 
@@ -1,12 +1,53 @@
+import functools
 from typing import List, Dict, Optional, Union, Any
 
 
+# --- Relation Caches ---
+
+# Entries per cache before it is emptied
+TYPE_CACHE_SIZE = 4096
+
+_subtype_cache = {}
+_unify_cache = {}
+_lub_cache = {}
+
+
+def _memoized(cache: dict, identity_result=None):
+    """
+    Cache a (Type, Type) -> result relation by the identity of both
+    arguments, so repeated checks of the same pair (every call of a common
+    signature, say) skip the structural walk. Entries hold on to both
+    types, so their ids cannot be reused while cached. Composite types
+    must not be mutated once they have been compared.
+
+    A type related to itself is answered before any lookup or recursion:
+    with `identity_result` if given, else with the type itself.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def cached(t1, t2):
+            if t1 is t2:
+                return t1 if identity_result is None else identity_result
+            key = (id(t1), id(t2))
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[2]
+            result = fn(t1, t2)
+            if len(cache) >= TYPE_CACHE_SIZE:
+                cache.clear()
+            cache[key] = (t1, t2, result)
+            return result
+        return cached
+    return decorate
+
+
 # --- Base Type Class ---
 
 class Type:
     """
     Base class for all HelixLang types.
     """
+    __slots__ = ()
 
     def is_subtype_of(self, other: 'Type') -> bool:
         """
@@ -34,59 +75,100 @@ class Type:
 
 # --- Primitive Types ---
 
-class IntType(Type):
+class PrimitiveType(Type):
+    """
+    A type without parameters. Each subclass has a single instance:
+    constructing one returns the shared object (see the INT, FLOAT, ...
+    constants below), so comparisons are mostly identity checks and
+    instances can be used as dict keys. INT and FLOAT are the exception,
+    see FloatType.
+    """
+    __slots__ = ()
+
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+
     def __eq__(self, other):
-        return isinstance(other, IntType)
+        return other is self or isinstance(other, type(self))
+
+    def __hash__(self):
+        return id(type(self))
 
 
-class FloatType(Type):
+class IntType(PrimitiveType):
+    __slots__ = ()
+
+    # Unhashable, like FloatType: see there
+    __hash__ = None
+
+
+class FloatType(PrimitiveType):
+    """
+    FLOAT == INT holds but INT == FLOAT does not, so no hash can be
+    consistent with both: a dict or set holding one of them would find
+    the other or not depending on insertion order. Int and Float are
+    left unhashable instead; lookups by type use the classes as keys.
+    """
+    __slots__ = ()
+
     def __eq__(self, other):
-        return isinstance(other, FloatType) or isinstance(other, IntType)  # Int <: Float
+        return other is self or isinstance(other, FloatType) or isinstance(other, IntType)  # Int <: Float
+
+    __hash__ = None
 
     def is_subtype_of(self, other: 'Type') -> bool:
         # FloatType is subtype of itself only
-        return isinstance(other, FloatType)
+        return other is self or isinstance(other, FloatType)
 
     def unify(self, other: 'Type') -> Optional['Type']:
         if isinstance(other, IntType) or isinstance(other, FloatType):
-            return FloatType()
+            return FLOAT
         return None
 
 
-class BoolType(Type):
-    def __eq__(self, other):
-        return isinstance(other, BoolType)
+class BoolType(PrimitiveType):
+    __slots__ = ()
 
 
-class StringType(Type):
-    def __eq__(self, other):
-        return isinstance(other, StringType)
+class StringType(PrimitiveType):
+    __slots__ = ()
 
 
 # --- Domain-Specific Types ---
 
-class GenomeType(Type):
+class GenomeType(PrimitiveType):
     """
     Represents genome sequences in HelixLang.
     """
-    def __eq__(self, other):
-        return isinstance(other, GenomeType)
+    __slots__ = ()
 
 
-class ProteinType(Type):
+class ProteinType(PrimitiveType):
     """
     Represents protein sequences or structures.
     """
-    def __eq__(self, other):
-        return isinstance(other, ProteinType)
+    __slots__ = ()
 
 
-class CellType(Type):
+class CellType(PrimitiveType):
     """
     Represents biological cells.
     """
-    def __eq__(self, other):
-        return isinstance(other, CellType)
+    __slots__ = ()
+
+
+# Shared primitive instances; calling the class returns the same object
+INT = IntType()
+FLOAT = FloatType()
+BOOL = BoolType()
+STRING = StringType()
+GENOME = GenomeType()
+PROTEIN = ProteinType()
+CELL = CellType()
 
 
 # --- Composite / Constructed Types ---
@@ -101,11 +183,13 @@ class ArrayType(Type):
     def __eq__(self, other):
         return isinstance(other, ArrayType) and self.element_type == other.element_type
 
+    @_memoized(_subtype_cache, True)
     def is_subtype_of(self, other: 'Type') -> bool:
         if not isinstance(other, ArrayType):
             return False
         return self.element_type.is_subtype_of(other.element_type)
 
+    @_memoized(_unify_cache)
     def unify(self, other: 'Type') -> Optional['Type']:
         if not isinstance(other, ArrayType):
             return None
@@ -121,17 +205,26 @@ class ArrayType(Type):
 class TupleType(Type):
     """
     Tuple of fixed length and types.
+
+    `element_types` is stored as a tuple, so equality is a single tuple
+    comparison, which checks length and tries identity per slot before
+    falling back to the element's __eq__.
     """
     def __init__(self, element_types: List[Type]):
-        self.element_types = element_types
+        self.element_types = tuple(element_types)
+        self._hash = None
 
     def __eq__(self, other):
-        if not isinstance(other, TupleType):
-            return False
-        return all(
-            a == b for a, b in zip(self.element_types, other.element_types)
-        ) and len(self.element_types) == len(other.element_types)
+        return isinstance(other, TupleType) and self.element_types == other.element_types
 
+    def __hash__(self):
+        # Computed on first use: hashing raises TypeError if an element
+        # type is unhashable (e.g. an ArrayType, INT or FLOAT)
+        if self._hash is None:
+            self._hash = hash((TupleType, self.element_types))
+        return self._hash
+
+    @_memoized(_subtype_cache, True)
     def is_subtype_of(self, other: 'Type') -> bool:
         if not isinstance(other, TupleType):
             return False
@@ -141,11 +234,14 @@ class TupleType(Type):
             a.is_subtype_of(b) for a, b in zip(self.element_types, other.element_types)
         )
 
+    @_memoized(_unify_cache)
     def unify(self, other: 'Type') -> Optional['Type']:
         if not isinstance(other, TupleType):
             return None
         if len(self.element_types) != len(other.element_types):
             return None
+        if not self.element_types:
+            return self
         unified_elements = []
         for a, b in zip(self.element_types, other.element_types):
             unified = a.unify(b)
@@ -159,13 +255,25 @@ class TupleType(Type):
         return f"Tuple[{elems}]"
 
 
+# Sorted field-name tuple -> shared instance, so structs with the same
+# field set can compare their names by identity
+_field_names: Dict[tuple, tuple] = {}
+
+
 class StructType(Type):
     """
     Named fields with associated types.
+
+    Besides the `fields` mapping, fields are kept as parallel tuples sorted
+    by name (`_names`, `_types`), which equality, subtyping and unification
+    walk in step instead of probing both dicts per field.
     """
     def __init__(self, name: str, fields: Dict[str, Type]):
         self.name = name
         self.fields = fields
+        names = tuple(sorted(fields))
+        self._names = _field_names.setdefault(names, names)
+        self._types = tuple(fields[k] for k in self._names)
 
     def __eq__(self, other):
         if not isinstance(other, StructType):
@@ -173,35 +281,46 @@ class StructType(Type):
         if self.name != other.name:
             return False
         # Exact field match (order doesn't matter)
-        return self.fields == other.fields
+        if self._names is not other._names:
+            return False
+        return all(a == b for a, b in zip(self._types, other._types))
 
+    @_memoized(_subtype_cache, True)
     def is_subtype_of(self, other: 'Type') -> bool:
         if not isinstance(other, StructType):
             return False
         if self.name != other.name:
             return False
-        # Struct subtyping could allow extra fields in self (width subtyping)
-        for key, typ in other.fields.items():
-            if key not in self.fields or not self.fields[key].is_subtype_of(typ):
+        names, types = self._names, self._types
+        if names is other._names:
+            return all(a.is_subtype_of(b) for a, b in zip(types, other._types))
+        # Struct subtyping could allow extra fields in self (width subtyping):
+        # merge over both sorted name lists, every field of other must be found
+        i, n = 0, len(names)
+        for key, typ in zip(other._names, other._types):
+            while i < n and names[i] < key:
+                i += 1
+            if i == n or names[i] != key or not types[i].is_subtype_of(typ):
                 return False
+            i += 1
         return True
 
+    @_memoized(_unify_cache)
     def unify(self, other: 'Type') -> Optional['Type']:
         if not isinstance(other, StructType) or self.name != other.name:
             return None
-        unified_fields = {}
-        for key in self.fields.keys() | other.fields.keys():
-            t1 = self.fields.get(key)
-            t2 = other.fields.get(key)
-            if t1 and t2:
-                unified = t1.unify(t2)
-                if unified is None:
-                    return None
-                unified_fields[key] = unified
-            else:
-                # One struct is missing the field -> no unification
+        if self._names is not other._names:
+            # One struct is missing a field -> no unification
+            return None
+        unified_types = []
+        for t1, t2 in zip(self._types, other._types):
+            if not (t1 and t2):
+                return None
+            unified = t1.unify(t2)
+            if unified is None:
                 return None
-        return StructType(self.name, unified_fields)
+            unified_types.append(unified)
+        return StructType(self.name, dict(zip(self._names, unified_types)))
 
     def __str__(self):
         fields_str = ", ".join(f"{k}: {v}" for k, v in self.fields.items())
@@ -213,16 +332,21 @@ class FunctionType(Type):
     Function signature: parameters and return type.
     """
     def __init__(self, param_types: List[Type], return_type: Type):
-        self.param_types = param_types
+        self.param_types = tuple(param_types)  # compared as one tuple, see TupleType
         self.return_type = return_type
+        self._hash = None
 
     def __eq__(self, other):
-        if not isinstance(other, FunctionType):
-            return False
-        return (len(self.param_types) == len(other.param_types) and
-                all(a == b for a, b in zip(self.param_types, other.param_types)) and
+        return (isinstance(other, FunctionType) and
+                self.param_types == other.param_types and
                 self.return_type == other.return_type)
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((FunctionType, self.param_types, self.return_type))
+        return self._hash
+
+    @_memoized(_subtype_cache, True)
     def is_subtype_of(self, other: 'Type') -> bool:
         """
         Function subtyping:
@@ -233,6 +357,8 @@ class FunctionType(Type):
             return False
         if len(self.param_types) != len(other.param_types):
             return False
+        if not self.param_types and self.return_type is other.return_type:
+            return True
         # Check contravariance for parameters
         for a, b in zip(other.param_types, self.param_types):
             if not a.is_subtype_of(b):
@@ -240,11 +366,14 @@ class FunctionType(Type):
         # Covariance for return type
         return self.return_type.is_subtype_of(other.return_type)
 
+    @_memoized(_unify_cache)
     def unify(self, other: 'Type') -> Optional['Type']:
         if not isinstance(other, FunctionType):
             return None
         if len(self.param_types) != len(other.param_types):
             return None
+        if not self.param_types and self.return_type is other.return_type:
+            return self
         unified_params = []
         for a, b in zip(self.param_types, other.param_types):
             unified = a.unify(b)
@@ -268,6 +397,15 @@ def least_upper_bound(t1: Type, t2: Type) -> Optional[Type]:
     Compute the least upper bound (common supertype) of two types,
     if it exists.
     """
+    # Pairs of primitives, most calls, are a single table lookup
+    result = _PRIMITIVE_LUB.get((type(t1), type(t2)), _MISSING)
+    if result is not _MISSING:
+        return result
+    return _least_upper_bound(t1, t2)
+
+
+@_memoized(_lub_cache)
+def _least_upper_bound(t1: Type, t2: Type) -> Optional[Type]:
     if t1.is_subtype_of(t2):
         return t2
     if t2.is_subtype_of(t1):
@@ -277,26 +415,42 @@ def least_upper_bound(t1: Type, t2: Type) -> Optional[Type]:
     # Example: int and float -> float
     if (isinstance(t1, IntType) and isinstance(t2, FloatType)) or \
        (isinstance(t2, IntType) and isinstance(t1, FloatType)):
-        return FloatType()
+        return FLOAT
     return None
 
 def are_compatible(t1: Type, t2: Type) -> bool:
     """
     Check if two types are compatible for assignments, function calls, etc.
     """
+    result = _PRIMITIVE_COMPATIBLE.get((type(t1), type(t2)))
+    if result is not None:
+        return result
     return t1.is_subtype_of(t2) or t2.is_subtype_of(t1)
 
 
 # --- Type Registry (Optional for quick lookup) ---
 
 PRIMITIVE_TYPES = {
-    "int": IntType(),
-    "float": FloatType(),
-    "bool": BoolType(),
-    "string": StringType(),
-    "genome": GenomeType(),
-    "protein": ProteinType(),
-    "cell": CellType()
+    "int": INT,
+    "float": FLOAT,
+    "bool": BOOL,
+    "string": STRING,
+    "genome": GENOME,
+    "protein": PROTEIN,
+    "cell": CELL
+}
+
+# (type(t1), type(t2)) -> result for every pair of primitives, computed
+# once with the general rules; the class is the key because each
+# primitive has a single instance
+_MISSING = object()
+_PRIMITIVE_LUB = {
+    (type(t1), type(t2)): _least_upper_bound.__wrapped__(t1, t2)
+    for t1 in PRIMITIVE_TYPES.values() for t2 in PRIMITIVE_TYPES.values()
+}
+_PRIMITIVE_COMPATIBLE = {
+    (type(t1), type(t2)): t1.is_subtype_of(t2) or t2.is_subtype_of(t1)
+    for t1 in PRIMITIVE_TYPES.values() for t2 in PRIMITIVE_TYPES.values()
 }
 
 
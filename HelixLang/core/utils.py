@@ -14,7 +14,9 @@ Designed to improve code reuse and clarity across HelixLang codebase.
 """
 
 import copy
+import functools
 import os
+import re
 import sys
 import json
 from collections import deque
@@ -24,6 +26,10 @@ from typing import Any, Callable, Dict, List, Optional, Union
 # STRING UTILITIES
 # -----------------------------------------------------
 
+# camel_to_snake patterns: a capitalized word, then a lower/digit-upper boundary
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+
 def indent(text: str, level: int = 1, indent_str: str = "    ") -> str:
     """
     Indent each line of `text` by `level` indentation levels.
@@ -38,9 +44,8 @@ def camel_to_snake(name: str) -> str:
     Convert CamelCase string to snake_case.
     Example: 'MyFunctionName' -> 'my_function_name'
     """
-    import re
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1).lower()
 
 
 def snake_to_camel(name: str) -> str:
@@ -103,36 +108,52 @@ def format_error_message(
 
 def traverse_ast(node: Any, visit_fn: Callable[[Any], None]) -> None:
     """
-    Recursively traverse AST nodes in preorder.
+    Traverse AST nodes in preorder.
     Applies visit_fn(node) to each node.
 
     Assumes each node has 'children' attribute or property that returns iterable of child nodes.
+    Uses an explicit stack, so deep trees do not hit the recursion limit.
     """
-    if node is None:
-        return
-    visit_fn(node)
-    children = getattr(node, "children", None)
-    if children:
-        for child in children:
-            traverse_ast(child, visit_fn)
+    stack = deque([node])
+    pop = stack.pop
+    while stack:
+        node = pop()
+        if node is None:
+            continue
+        visit_fn(node)
+        children = getattr(node, "children", None)
+        if children:
+            # Pushed last-first so the first child is visited next
+            stack.extend(reversed(_as_sequence(children)))
 
 
 def find_in_ast(node: Any, predicate: Callable[[Any], bool]) -> Optional[Any]:
     """
-    Recursively search AST for a node satisfying predicate.
+    Search AST in preorder for a node satisfying predicate.
     Returns the first matching node or None if not found.
     """
-    if predicate(node):
-        return node
-    children = getattr(node, "children", None)
-    if children:
-        for child in children:
-            found = find_in_ast(child, predicate)
-            if found is not None:
-                return found
+    stack = deque([node])
+    pop = stack.pop
+    while stack:
+        node = pop()
+        if predicate(node):
+            return node
+        children = getattr(node, "children", None)
+        if children:
+            stack.extend(reversed(_as_sequence(children)))
     return None
 
 
+def _as_sequence(children: Any):
+    """
+    Return `children` as something reversed() accepts; nodes may expose
+    children as any iterable.
+    """
+    if isinstance(children, (list, tuple)):
+        return children
+    return list(children)
+
+
 # -----------------------------------------------------
 # DATA STRUCTURE UTILITIES
 # -----------------------------------------------------
@@ -153,16 +174,20 @@ def flatten(nested_list: Union[List[Any], Any]) -> List[Any]:
     Flatten a nested list of arbitrary depth into a single list of atomic elements.
     Example: [1, [2, [3, 4], 5], 6] -> [1, 2, 3, 4, 5, 6]
     """
-    flat_list = []
+    if not isinstance(nested_list, list):
+        return [nested_list]
 
-    def _flatten(element):
+    flat_list = []
+    append = flat_list.append
+    # Lists are pushed last-first so elements come off in their original order
+    stack = [nested_list]
+    pop = stack.pop
+    while stack:
+        element = pop()
         if isinstance(element, list):
-            for item in element:
-                _flatten(item)
+            stack.extend(reversed(element))
         else:
-            flat_list.append(element)
-
-    _flatten(nested_list)
+            append(element)
     return flat_list
 
 
@@ -181,13 +206,31 @@ def merge_dicts(*dicts: Dict[Any, Any]) -> Dict[Any, Any]:
 # FILE I/O HELPERS
 # -----------------------------------------------------
 
+READ_CACHE_SIZE = 256  # files whose decoded contents read_file_utf8 keeps
+
+
+@functools.lru_cache(maxsize=READ_CACHE_SIZE)
+def _read_file_cached(filename: str, dev: int, ino: int, mtime_ns: int, size: int) -> str:
+    # The stat fields only form the cache key; a rewritten or replaced
+    # file gets a new key and is read again
+    with open(filename, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 def read_file_utf8(filename: str) -> str:
     """
     Read the entire contents of a UTF-8 encoded text file.
     Raises FileNotFoundError or UnicodeDecodeError on error.
+
+    Contents are cached by the file's identity, modification time and size,
+    so repeated reads of an unchanged file cost one stat() call. Use
+    read_file_utf8.cache_clear() to drop the cache.
     """
-    with open(filename, "r", encoding="utf-8") as f:
-        return f.read()
+    st = os.stat(filename)
+    return _read_file_cached(filename, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+read_file_utf8.cache_clear = _read_file_cached.cache_clear
 
 
 def write_file_utf8(filename: str, content: str) -> None:
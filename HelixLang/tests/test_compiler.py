@@ -169,3 +169,80 @@ def test_instruction_integrity():
     for instr in ir.flatten():
         assert isinstance(instr, IRInstruction)
         assert instr.op is not None
+
+
+# ---------------------
+# PARALLEL FUNCTION COMPILATION
+# ---------------------
+
+import helixlang.compiler as compiler_module
+from helixlang.compiler import Compiler
+from helixlang.ast_nodes import (
+    BinaryOpNode, BlockNode, FunctionDefNode, LiteralNode, ReturnNode, VariableNode,
+)
+
+
+def _ir_shape(value):
+    # Instructions compiled in a worker come back as copies, so compare
+    # their contents rather than the objects
+    if isinstance(value, (list, tuple)):
+        return [_ir_shape(v) for v in value]
+    if hasattr(value, "__dict__"):
+        return (type(value).__name__, {k: _ir_shape(v) for k, v in vars(value).items()})
+    return value
+
+
+def _program(depth=1, functions=8):
+    funcs = []
+    for i in range(functions):
+        expr = VariableNode("a", 1, 1)
+        for _ in range(depth):
+            expr = BinaryOpNode(expr, "+", LiteralNode(i, 1, 1), 1, 1)
+        body = BlockNode([ReturnNode(expr, 1, 1)], 1, 1)
+        funcs.append(FunctionDefNode(f"f{i}", ["a"], body, 1, 1))
+    return BlockNode(funcs, 1, 1)
+
+
+def _compile(program, monkeypatch, min_nodes):
+    with monkeypatch.context() as m:
+        m.setattr(compiler_module, "PARALLEL_MIN_NODES", min_nodes)
+        return Compiler().compile(program)
+
+def _compile_in_parallel(program, monkeypatch):
+    return _compile(program, monkeypatch, 0)
+
+def _compile_sequentially(program, monkeypatch):
+    return _compile(program, monkeypatch, float("inf"))
+
+
+def test_parallel_function_compilation_matches_sequential(monkeypatch):
+    program = _program()
+    parallel = _compile_in_parallel(program, monkeypatch)
+    assert compiler_module._process_pool is not None
+    assert _ir_shape(parallel) == _ir_shape(_compile_sequentially(program, monkeypatch))
+
+def test_parallel_compilation_reuses_the_worker_pool(monkeypatch):
+    _compile_in_parallel(_program(), monkeypatch)
+    pool = compiler_module._process_pool
+    _compile_in_parallel(_program(), monkeypatch)
+    assert compiler_module._process_pool is pool
+
+def test_parallel_compilation_falls_back_when_ast_cannot_be_pickled(monkeypatch):
+    # Too deep for pickle's recursion limit; the bodies are compiled in-process instead
+    program = _program(depth=3000)
+    parallel = _compile_in_parallel(program, monkeypatch)
+    assert _ir_shape(parallel) == _ir_shape(_compile_sequentially(program, monkeypatch))
+
+def test_parallel_compilation_falls_back_on_unpicklable_node_state(monkeypatch):
+    program = _program()
+    program.statements[0].body.statements[0].value.compiled = lambda env: None
+    parallel = _compile_in_parallel(program, monkeypatch)
+    assert _ir_shape(parallel) == _ir_shape(_compile_sequentially(program, monkeypatch))
+
+def test_small_programs_are_compiled_in_process(monkeypatch):
+    def fail(*args):
+        raise AssertionError("worker pool used for a small program")
+    monkeypatch.setattr(compiler_module, "_get_process_pool", fail)
+    program = _program()
+    assert _ir_shape(Compiler().compile(program)) == _ir_shape(_compile_sequentially(program, monkeypatch))
+
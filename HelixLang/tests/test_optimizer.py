@@ -0,0 +1,67 @@
+from helixlang.ast_nodes import (
+    AssignmentNode, BinaryOpNode, BlockNode, FunctionDefNode, IfNode,
+    LiteralNode, ReturnNode, VariableNode,
+)
+from helixlang.optimizer import Optimizer
+
+
+# ---------------------
+# AST BUILDERS
+# ---------------------
+
+def _lit(value):
+    return LiteralNode(value, 1, 1)
+
+def _var(name):
+    return VariableNode(name, 1, 1)
+
+def _add(left, right):
+    return BinaryOpNode(left, "+", right, 1, 1)
+
+def _assign(name, value):
+    return AssignmentNode(_var(name), value, 1, 1)
+
+
+# ---------------------
+# CACHED FORMS AFTER REWRITES
+# ---------------------
+
+
+def test_constant_folding_refreshes_printed_ancestors():
+    program = BlockNode([_assign("x", _add(_add(_lit(1), _lit(2)), _var("y")))], 1, 1)
+    assert "(1 + 2)" in str(program)
+
+    program = Optimizer([Optimizer().constant_folding]).optimize(program)
+
+    expected = BlockNode([_assign("x", _add(_lit(3), _var("y")))], 1, 1)
+    assert str(program) == str(expected)
+    assert str(program.statements[0]) == str(expected.statements[0])
+
+def test_dead_code_elimination_refreshes_printed_ancestors():
+    body = BlockNode([
+        IfNode(_lit(True), _assign("a", _lit(1)), _assign("a", _lit(2)), 1, 1),
+        ReturnNode(_var("a"), 1, 1),
+        _assign("b", _lit(3)),
+    ], 1, 1)
+    func = FunctionDefNode("f", [], body, 1, 1)
+    assert "b = " in str(func)
+
+    func = Optimizer([Optimizer().dead_code_elimination]).optimize(func)
+
+    expected = FunctionDefNode("f", [], BlockNode([
+        _assign("a", _lit(1)),
+        ReturnNode(_var("a"), 1, 1),
+    ], 1, 1), 1, 1)
+    assert str(func) == str(expected)
+
+def test_folding_resets_compiled_closures_of_ancestors():
+    inner = _add(_lit(1), _lit(2))
+    middle = _add(inner, _var("y"))
+    outer = _add(middle, _var("z"))
+    middle.compiled = outer.compiled = lambda interp: None  # as left by the interpreter
+
+    Optimizer().optimize(outer)
+
+    assert middle.left is not inner
+    assert middle.compiled is None
+    assert outer.compiled is None
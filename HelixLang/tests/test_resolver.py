@@ -0,0 +1,245 @@
+import pytest
+from helixlang.ast_nodes import (
+    AssignmentNode, BinaryOpNode, BlockNode, CallNode, ForNode, FunctionDefNode,
+    IfNode, LiteralNode, ReturnNode, VariableDeclNode, VariableNode, WhileNode,
+)
+from helixlang.interpreter import Interpreter
+from helixlang.resolver import Resolver
+
+
+# ---------------------
+# AST BUILDERS
+# ---------------------
+
+def lit(value):
+    return LiteralNode(value, 1, 1)
+
+def var(name):
+    return VariableNode(name, 1, 1)
+
+def binop(left, op, right):
+    return BinaryOpNode(left, op, right, 1, 1)
+
+def let(name, initializer):
+    return VariableDeclNode(name, initializer, 1, 1)
+
+def assign(name, value):
+    return AssignmentNode(var(name), value, 1, 1)
+
+def block(*statements):
+    return BlockNode(list(statements), 1, 1)
+
+def fn(name, params, *statements):
+    return FunctionDefNode(name, list(params), block(*statements), 1, 1)
+
+def ret(value=None):
+    return ReturnNode(value, 1, 1)
+
+def call(name, *args):
+    return CallNode(var(name), list(args), 1, 1)
+
+def if_(condition, then_branch, else_branch=None):
+    return IfNode(condition, then_branch, else_branch, 1, 1)
+
+def for_(name, start, op, end, step, *body):
+    return ForNode(let(name, start), binop(var(name), op, end),
+                   assign(name, binop(var(name), "+", lit(step))), block(*body), 1, 1)
+
+
+def run(*statements):
+    """Run top-level statements in one interpreter; returns the last one's value."""
+    interp = Interpreter()
+    for stmt in statements[:-1]:
+        interp.interpret(stmt)
+    return interp.interpret(statements[-1])
+
+
+# ---------------------
+# SLOT BINDING
+# ---------------------
+
+def test_locals_bind_to_depth_and_slot():
+    inner_b, inner_a, inner_c, glob = var("b"), var("a"), var("c"), var("g")
+    f = fn("f", ["a"],
+           let("b", var("a")),
+           block(let("c", inner_b), ret(binop(binop(inner_c, "+", inner_a), "+", glob))))
+    Resolver().resolve(f)
+
+    assert (inner_a.depth, inner_a.slot) == (1, 0)
+    assert (inner_b.depth, inner_b.slot) == (1, 1)
+    assert (inner_c.depth, inner_c.slot) == (0, 0)
+    assert glob.depth is None
+    assert f.local_names == ("a", "b")
+    assert f.local_count == 2
+
+def test_inner_declaration_shadows_outer():
+    f = fn("f", [],
+           let("x", lit(1)),
+           block(let("x", lit(2))),
+           ret(var("x")))
+    assert run(f, call("f")) == 1
+
+def test_initializer_sees_outer_binding():
+    # `let x = x` reads the enclosing x, not the one being declared
+    f = fn("f", [], let("x", binop(var("x"), "+", lit(1))), ret(var("x")))
+    assert run(let("x", lit(1)), f, call("f")) == 2
+
+def test_duplicate_params_last_one_wins():
+    f = fn("f", ["a", "a"], ret(var("a")))
+    assert run(f, call("f", lit(1), lit(2))) == 2
+    assert f.local_names == (None, "a")
+
+
+# ---------------------
+# CLOSURES & LOCAL FUNCTIONS
+# ---------------------
+
+def test_closure_keeps_its_own_frame():
+    make = fn("make", [],
+              let("n", lit(0)),
+              fn("inc", [], assign("n", binop(var("n"), "+", lit(1))), ret(var("n"))),
+              ret(var("inc")))
+    interp = Interpreter()
+    interp.interpret(make)
+    interp.interpret(let("c1", call("make")))
+    interp.interpret(let("c2", call("make")))
+    interp.interpret(call("c1"))
+    assert interp.interpret(call("c1")) == 2
+    assert interp.interpret(call("c2")) == 1
+
+def test_nested_function_sees_local_declared_after_it():
+    f = fn("f", [],
+           fn("g", [], ret(var("y"))),
+           let("y", lit(5)),
+           ret(call("g")))
+    assert run(f, call("f")) == 5
+
+def test_local_functions_are_mutually_recursive():
+    even = fn("even", ["k"],
+              if_(binop(var("k"), "==", lit(0)), ret(lit(True))),
+              ret(call("odd", binop(var("k"), "-", lit(1)))))
+    odd = fn("odd", ["k"],
+             if_(binop(var("k"), "==", lit(0)), ret(lit(False))),
+             ret(call("even", binop(var("k"), "-", lit(1)))))
+    f = fn("f", ["n"], even, odd, ret(call("even", var("n"))))
+    interp = Interpreter()
+    interp.interpret(f)
+    assert interp.interpret(call("f", lit(10))) is True
+    assert interp.interpret(call("f", lit(7))) is False
+
+
+# ---------------------
+# RETURN INSIDE LOOPS
+# ---------------------
+
+def test_return_from_inside_while_loop():
+    f = fn("f", [],
+           let("i", lit(0)),
+           WhileNode(binop(var("i"), "<", lit(10)),
+                     block(if_(binop(var("i"), "==", lit(3)), block(ret(var("i")))),
+                           assign("i", binop(var("i"), "+", lit(1)))), 1, 1),
+           ret(lit(-1)))
+    interp = Interpreter()
+    interp.interpret(f)
+    assert interp.interpret(call("f")) == 3
+    assert interp._returning is False
+    assert interp.interpret(call("f")) == 3
+
+def test_return_from_inside_for_loop():
+    f = fn("f", [],
+           for_("i", lit(0), "<", lit(10), 1, if_(binop(var("i"), "==", lit(4)), ret(var("i")))),
+           ret(lit(-1)))
+    assert run(f, call("f")) == 4
+
+
+# ---------------------
+# COUNTED FOR LOOPS
+# ---------------------
+
+def test_for_loop_end_bound_modified_by_body():
+    f = fn("f", [],
+           let("n", lit(10)),
+           let("count", lit(0)),
+           for_("i", lit(0), "<", var("n"), 1,
+                assign("n", binop(var("n"), "-", lit(1))),
+                assign("count", binop(var("count"), "+", lit(1)))),
+           ret(var("count")))
+    assert run(f, call("f")) == 5
+
+@pytest.mark.parametrize("start, op, end, step, expected", [
+    (0, "<", 3, 1, 3),
+    (0, "<=", 3, 1, 4),
+    (0, "<", 10, 4, 12),
+])
+def test_for_loop_leaves_final_loop_variable_value(start, op, end, step, expected):
+    # The closure reads i from the loop's frame after the loop has finished
+    f = fn("f", [],
+           let("last", lit(0)),
+           for_("i", lit(start), op, lit(end), step,
+                fn("get", [], ret(var("i"))),
+                assign("last", var("get"))),
+           ret(call("last")))
+    assert run(f, call("f")) == expected
+
+@pytest.mark.parametrize("start, end, expected", [
+    (0, 2.5, 3),
+    (0.5, 3, 3),
+])
+def test_for_loop_with_float_bounds(start, end, expected):
+    f = fn("f", [],
+           let("count", lit(0)),
+           for_("i", lit(start), "<", lit(end), 1,
+                assign("count", binop(var("count"), "+", lit(1)))),
+           ret(var("count")))
+    assert run(f, call("f")) == expected
+
+
+# ---------------------
+# TAIL CALLS
+# ---------------------
+
+def test_deep_tail_recursion_does_not_grow_the_stack():
+    count = fn("count", ["n", "acc"],
+               if_(binop(var("n"), "==", lit(0)), ret(var("acc"))),
+               ret(call("count", binop(var("n"), "-", lit(1)), binop(var("acc"), "+", lit(1)))))
+    assert run(count, call("count", lit(100000), lit(0))) == 100000
+
+def test_arity_error_in_tail_called_function(capsys):
+    g = fn("g", ["a"], ret(var("a")))
+    f = fn("f", [], ret(call("g", lit(1), lit(2))))
+    interp = Interpreter()
+    interp.interpret(g)
+    interp.interpret(f)
+    assert interp.interpret(call("f")) is None
+    assert "Expected 1 arguments but got 2" in capsys.readouterr().out
+    # The caller's environment is restored and the interpreter still works
+    assert interp.env is interp.global_env
+    assert interp.interpret(call("g", lit(7))) == 7
+
+def test_top_level_return_still_calls_the_function(capsys):
+    f = fn("f", [], assign("hits", binop(var("hits"), "+", lit(1))), ret(var("hits")))
+    interp = Interpreter()
+    interp.interpret(let("hits", lit(0)))
+    interp.interpret(f)
+    assert interp.interpret(ret(call("f"))) is None
+    assert "Unexpected return statement outside function." in capsys.readouterr().out
+    assert interp.interpret(var("hits")) == 1
+    assert interp._tail_call is None and interp._returning is False
+
+
+# ---------------------
+# SHORT-CIRCUIT OPERATORS
+# ---------------------
+
+def test_and_skips_right_operand_when_left_is_false():
+    # `undefined` would raise if it were evaluated
+    assert run(binop(lit(False), "&&", var("undefined"))) is False
+    assert run(binop(lit(True), "&&", lit(1))) is True
+
+def test_or_skips_right_operand_when_left_is_true():
+    assert run(binop(lit(True), "||", var("undefined"))) is True
+    assert run(binop(lit(False), "||", lit(0))) is False
+
+def test_short_circuit_right_operand_errors_when_evaluated(capsys):
+    assert run(binop(lit(True), "&&", var("undefined"))) is None
+    assert "Undefined variable 'undefined'" in capsys.readouterr().out